@@ -1,5 +1,7 @@
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, event, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
@@ -7,10 +9,44 @@ DEFAULT_SQLITE_PATH = os.path.join(BASE_DIR, "community.db")
 # For dev: local SQLite file. Later we can move to MySQL/Postgres easily.
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DEFAULT_SQLITE_PATH}")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # needed for SQLite in single-threaded dev
-)
+# Sync endpoints hold one pooled connection per AnyIO worker thread (40 unless
+# API_THREADPOOL_SIZE says otherwise), so pool_size + max_overflow should cover that many.
+POOL_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+}
+
+if DATABASE_URL.startswith("sqlite"):
+    ENGINE_OPTIONS = {
+        "connect_args": {"check_same_thread": False},  # needed for SQLite in single-threaded dev
+    }
+    if DATABASE_URL not in ("sqlite://", "sqlite:///:memory:"):
+        ENGINE_OPTIONS.update(POOL_OPTIONS)  # file databases get a QueuePool
+else:
+    ENGINE_OPTIONS = {
+        **POOL_OPTIONS,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
+
+engine = create_engine(DATABASE_URL, **ENGINE_OPTIONS)
+
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, _connection_record):
+        # WAL lets readers proceed while a writer commits; NORMAL sync is safe with WAL.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
+
+
+# Dialect-specific insert() constructs that support ON CONFLICT upserts.
+UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -19,6 +55,9 @@ Base = declarative_base()
 
 def get_db():
     """FastAPI dependency that yields a db session."""
+    # One plain Session per request on purpose: FastAPI runs the setup and teardown of sync
+    # dependencies on arbitrary threadpool threads, so a thread-local scoped_session could be
+    # shared by concurrent requests or removed from the wrong thread.
     db = SessionLocal()
     try:
         yield db
@@ -26,30 +65,113 @@ def get_db():
         db.close()
 
 
-def _sqlite_has_column(connection, table_name: str, column_name: str) -> bool:
-    rows = connection.execute(text(f"PRAGMA table_info('{table_name}')"))
-    return any(row[1] == column_name for row in rows)
+# Table-valued form of PRAGMA table_info, so the table name can be a bound parameter.
+_TABLE_COLUMNS = text("SELECT name FROM pragma_table_info(:table_name)")
+_INCIDENTS_HAVE_ROWS = text("SELECT 1 FROM incidents LIMIT 1")
+_LEDGER_HAS_ENTRIES = text("SELECT 1 FROM reward_ledger LIMIT 1")
+_LEDGER_SEED_BALANCES = text(
+    "INSERT INTO reward_ledger (user_id, delta, source, description, status) "
+    "SELECT id, reward_points, 'balance-forward', 'Existing balance snapshot', 'posted' "
+    "FROM users WHERE reward_points IS NOT NULL AND reward_points > 0"
+)
+# Mirrors the composite indexes declared in models.py for databases created before them.
+COMPOSITE_INDEX_STATEMENTS = (
+    text("CREATE INDEX IF NOT EXISTS ix_incidents_feed ON incidents (is_hidden, incident_type, created_at)"),
+    text("CREATE INDEX IF NOT EXISTS ix_incidents_reporter_created ON incidents (reporter_user_id, created_at)"),
+    text("CREATE INDEX IF NOT EXISTS ix_incidents_reporter_status ON incidents (reporter_user_id, status)"),
+    text("CREATE INDEX IF NOT EXISTS ix_incidents_status_created ON incidents (status, created_at)"),
+    text("CREATE INDEX IF NOT EXISTS ix_incidents_category_created ON incidents (category, created_at)"),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_comments_incident_hidden "
+        "ON incident_comments (incident_id, is_hidden, created_at)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_incident_reactions_agg "
+        "ON incident_reactions (incident_id, value, user_id)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_comment_reactions_agg "
+        "ON incident_comment_reactions (comment_id, value, user_id)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_notifications_recipient_created "
+        "ON notifications (recipient_id, created_at)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_notifications_recipient_status_created "
+        "ON notifications (recipient_id, status, created_at)"
+    ),
+    text("CREATE INDEX IF NOT EXISTS ix_reward_ledger_user_created ON reward_ledger (user_id, created_at)"),
+    text("CREATE INDEX IF NOT EXISTS ix_reward_ledger_queue ON reward_ledger (source, status, created_at)"),
+)
+_USERS_PROVIDER_SUBJECT_DUPLICATES = text(
+    "SELECT 1 FROM users WHERE provider_subject IS NOT NULL "
+    "GROUP BY auth_provider, provider_subject HAVING COUNT(*) > 1 LIMIT 1"
+)
+_USERS_PROVIDER_SUBJECT_UNIQUE_INDEX = text(
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_provider_subject ON users (auth_provider, provider_subject)"
+)
+# Legacy databases holding duplicate provider identities still get the lookup index.
+_USERS_PROVIDER_SUBJECT_INDEX = text(
+    "CREATE INDEX IF NOT EXISTS ix_users_provider_subject ON users (auth_provider, provider_subject)"
+)
+
+
+def _sqlite_table_columns(connection, table_name: str) -> set[str]:
+    rows = connection.execute(_TABLE_COLUMNS, {"table_name": table_name})
+    return {row[0] for row in rows}
+
+
+_LEGACY_ATTACHMENTS_TABLE = "incident_comment_attachments_legacy"
+_LEGACY_ATTACHMENT_INDEXES = (
+    "ix_incident_comment_attachments_id",
+    "ix_incident_comment_attachments_comment_id",
+    "ix_incident_comment_attachments_created_at",
+)
+
+
+def _rebuild_comment_attachments_as_binary(connection) -> None:
+    """Move base64 TEXT attachments into the raw-bytes ``data`` column (SQLite cannot retype in place)."""
+    from . import models
+    from .services.media import decode_base64_payload
+
+    connection.execute(
+        text(f"ALTER TABLE incident_comment_attachments RENAME TO {_LEGACY_ATTACHMENTS_TABLE}")
+    )
+    for index_name in _LEGACY_ATTACHMENT_INDEXES:
+        connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    models.IncidentCommentAttachment.__table__.create(connection)
+
+    insert_row = text(
+        "INSERT INTO incident_comment_attachments "
+        "(id, comment_id, media_type, content_type, data, filename, created_at) "
+        "VALUES (:id, :comment_id, :media_type, :content_type, :data, :filename, :created_at)"
+    )
+    legacy_rows = connection.execute(
+        text(
+            "SELECT id, comment_id, media_type, content_type, data_base64, filename, created_at "
+            f"FROM {_LEGACY_ATTACHMENTS_TABLE}"
+        )
+    ).mappings()
+    for row in legacy_rows:
+        values = dict(row)
+        payload = values.pop("data_base64")
+        decoded = decode_base64_payload(payload)
+        # Keep undecodable payloads byte-for-byte rather than dropping them.
+        values["data"] = decoded if decoded is not None else (payload or "").encode("utf-8")
+        connection.execute(insert_row, values)
+    connection.execute(text(f"DROP TABLE {_LEGACY_ATTACHMENTS_TABLE}"))
 
 
 def _seed_reward_ledger_if_empty(connection) -> None:
     try:
-        ledger_count = connection.execute(text("SELECT COUNT(1) FROM reward_ledger")).scalar()
+        has_entries = connection.execute(_LEDGER_HAS_ENTRIES).first()
     except Exception:
         return
-    if ledger_count and ledger_count > 0:
+    if has_entries is not None:
         return
 
-    rows = connection.execute(
-        text("SELECT id, reward_points FROM users WHERE reward_points IS NOT NULL AND reward_points > 0")
-    ).fetchall()
-    for user_id, reward_points in rows:
-        connection.execute(
-            text(
-                "INSERT INTO reward_ledger (user_id, delta, source, description, status) "
-                "VALUES (:user_id, :delta, 'balance-forward', 'Existing balance snapshot', 'posted')"
-            ),
-            {"user_id": user_id, "delta": reward_points},
-        )
+    connection.execute(_LEDGER_SEED_BALANCES)
 
 
 VALID_CONTACTED_AUTHORITIES = {"unknown", "none", "service-request", "911", "not-needed"}
@@ -65,32 +187,70 @@ SENTIMENT_FALLBACKS = {
     "neutral": "safe",
     "ok": "safe",
 }
+VALID_INCIDENT_TYPES = {"police", "community", "public-order"}
+INCIDENT_TYPE_FALLBACKS = {
+    "public_order": "public-order",
+    "public order": "public-order",
+    "law-enforcement": "police",
+}
+VALID_REACTION_VALUES = {"like", "unlike"}
+REACTION_FALLBACKS = {"dislike": "unlike"}
 
 
-def _normalize_incident_enum(connection, column_name: str, valid_values, fallback_map, default_value) -> None:
+def _normalize_incident_enum(
+    connection,
+    column_name: str,
+    valid_values,
+    fallback_map,
+    default_value,
+    table_name: str = "incidents",
+) -> None:
     """Clamp legacy/invalid incident enum values to supported options."""
-    rows = connection.execute(
-        text(f"SELECT id, {column_name} FROM incidents WHERE {column_name} IS NOT NULL")
-    ).fetchall()
-    for row_id, raw_value in rows:
-        value = raw_value.strip() if isinstance(raw_value, str) else raw_value
-        if not value:
-            replacement = default_value
-        elif value in valid_values:
-            continue
-        else:
-            replacement = fallback_map.get(value, default_value)
+    params = {"valid": sorted(valid_values), "default_value": default_value}
+    probe = text(
+        f"SELECT 1 FROM {table_name} WHERE {column_name} IS NOT NULL AND {column_name} NOT IN :valid LIMIT 1"
+    ).bindparams(bindparam("valid", expanding=True))
+    if connection.execute(probe, {"valid": params["valid"]}).first() is None:
+        return
 
-        if replacement is None:
-            connection.execute(
-                text(f"UPDATE incidents SET {column_name} = NULL WHERE id = :row_id"),
-                {"row_id": row_id},
-            )
-        else:
-            connection.execute(
-                text(f"UPDATE incidents SET {column_name} = :replacement WHERE id = :row_id"),
-                {"replacement": replacement, "row_id": row_id},
-            )
+    cases = [f"WHEN TRIM({column_name}) IN :valid THEN TRIM({column_name})"]
+    for index, (legacy, replacement) in enumerate(sorted(fallback_map.items())):
+        cases.append(f"WHEN TRIM({column_name}) = :legacy_{index} THEN :replacement_{index}")
+        params[f"legacy_{index}"] = legacy
+        params[f"replacement_{index}"] = replacement
+
+    statement = text(
+        f"UPDATE {table_name} SET {column_name} = CASE {' '.join(cases)} ELSE :default_value END "
+        f"WHERE {column_name} IS NOT NULL AND {column_name} NOT IN :valid"
+    ).bindparams(bindparam("valid", expanding=True))
+    connection.execute(statement, params)
+
+
+def _normalize_reaction_values(connection, table_name: str) -> None:
+    """Map legacy reaction spellings; reactions that map to nothing are dropped rather than guessed."""
+    valid = bindparam("valid", expanding=True)
+    probe = text(f"SELECT 1 FROM {table_name} WHERE value NOT IN :valid LIMIT 1").bindparams(valid)
+    if connection.execute(probe, {"valid": sorted(VALID_REACTION_VALUES)}).first() is None:
+        return
+
+    for legacy, replacement in REACTION_FALLBACKS.items():
+        connection.execute(
+            text(f"UPDATE {table_name} SET value = :replacement WHERE TRIM(value) = :legacy"),
+            {"legacy": legacy, "replacement": replacement},
+        )
+    connection.execute(
+        text(f"UPDATE {table_name} SET value = TRIM(value) WHERE TRIM(value) IN :valid").bindparams(valid),
+        {"valid": sorted(VALID_REACTION_VALUES)},
+    )
+    connection.execute(
+        text(f"DELETE FROM {table_name} WHERE value NOT IN :valid").bindparams(valid),
+        {"valid": sorted(VALID_REACTION_VALUES)},
+    )
+
+
+# Bump whenever ensure_sqlite_schema gains a new patch so stamped databases re-run it.
+SQLITE_SCHEMA_VERSION = 9
+_READ_USER_VERSION = text("PRAGMA user_version")
 
 
 def ensure_sqlite_schema():
@@ -99,55 +259,123 @@ def ensure_sqlite_schema():
         return
 
     with engine.begin() as connection:
-        if not _sqlite_has_column(connection, "users", "role"):
+        schema_version = connection.execute(_READ_USER_VERSION).scalar() or 0
+        if schema_version >= SQLITE_SCHEMA_VERSION:
+            return
+
+        columns = {
+            table_name: _sqlite_table_columns(connection, table_name)
+            for table_name in ("users", "incidents", "incident_comments", "incident_comment_attachments")
+        }
+        if "role" not in columns["users"]:
             connection.execute(
                 text("ALTER TABLE users ADD COLUMN role VARCHAR(25) NOT NULL DEFAULT 'resident'")
             )
-        if not _sqlite_has_column(connection, "users", "reward_points"):
+        if "reward_points" not in columns["users"]:
             connection.execute(
                 text("ALTER TABLE users ADD COLUMN reward_points INTEGER NOT NULL DEFAULT 0")
             )
-        if not _sqlite_has_column(connection, "incidents", "reporter_user_id"):
+        if "reporter_user_id" not in columns["incidents"]:
             connection.execute(
                 text("ALTER TABLE incidents ADD COLUMN reporter_user_id INTEGER")
             )
             connection.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_incidents_reporter_user_id ON incidents (reporter_user_id)")
             )
-        if not _sqlite_has_column(connection, "incidents", "reward_points_awarded"):
+        if "reward_points_awarded" not in columns["incidents"]:
             connection.execute(
                 text("ALTER TABLE incidents ADD COLUMN reward_points_awarded INTEGER NOT NULL DEFAULT 0")
             )
-        if not _sqlite_has_column(connection, "incidents", "verification_alert_sent"):
+        if "verification_alert_sent" not in columns["incidents"]:
             connection.execute(
                 text("ALTER TABLE incidents ADD COLUMN verification_alert_sent BOOLEAN NOT NULL DEFAULT 0")
             )
-        if not _sqlite_has_column(connection, "incidents", "is_hidden"):
+        if "is_hidden" not in columns["incidents"]:
             connection.execute(
                 text("ALTER TABLE incidents ADD COLUMN is_hidden BOOLEAN NOT NULL DEFAULT 0")
             )
             connection.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_incidents_is_hidden ON incidents (is_hidden)")
             )
-        if not _sqlite_has_column(connection, "incident_comments", "is_hidden"):
+        if "is_hidden" not in columns["incident_comments"]:
             connection.execute(
                 text("ALTER TABLE incident_comments ADD COLUMN is_hidden BOOLEAN NOT NULL DEFAULT 0")
             )
             connection.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_incident_comments_is_hidden ON incident_comments (is_hidden)")
             )
-        _normalize_incident_enum(
-            connection,
-            "contacted_authorities",
-            VALID_CONTACTED_AUTHORITIES,
-            CONTACTED_FALLBACKS,
-            "unknown",
-        )
-        _normalize_incident_enum(
-            connection,
-            "safety_sentiment",
-            VALID_SAFETY_SENTIMENTS,
-            SENTIMENT_FALLBACKS,
-            None,
-        )
+        if "data_base64" in columns["incident_comment_attachments"]:
+            _rebuild_comment_attachments_as_binary(connection)
+        for statement in COMPOSITE_INDEX_STATEMENTS:
+            connection.execute(statement)
+        # Superseded by the composite indexes that lead with the same column.
+        connection.execute(text("DROP INDEX IF EXISTS ix_incidents_category"))
+        connection.execute(text("DROP INDEX IF EXISTS ix_incidents_reporter_user_id"))
+        connection.execute(text("DROP INDEX IF EXISTS ix_reward_ledger_user_id"))
+        connection.execute(text("DROP INDEX IF EXISTS ix_notifications_recipient_id"))
+        if connection.execute(_USERS_PROVIDER_SUBJECT_DUPLICATES).first() is None:
+            connection.execute(_USERS_PROVIDER_SUBJECT_UNIQUE_INDEX)
+        else:
+            connection.execute(_USERS_PROVIDER_SUBJECT_INDEX)
+        # Fresh databases have nothing to clean up; skip the enum probes entirely.
+        if connection.execute(_INCIDENTS_HAVE_ROWS).first() is not None:
+            _normalize_incident_enum(
+                connection,
+                "incident_type",
+                VALID_INCIDENT_TYPES,
+                INCIDENT_TYPE_FALLBACKS,
+                "community",
+            )
+            _normalize_incident_enum(
+                connection,
+                "contacted_authorities",
+                VALID_CONTACTED_AUTHORITIES,
+                CONTACTED_FALLBACKS,
+                "unknown",
+            )
+            _normalize_incident_enum(
+                connection,
+                "safety_sentiment",
+                VALID_SAFETY_SENTIMENTS,
+                SENTIMENT_FALLBACKS,
+                None,
+            )
+            # Follow-ups share the enum columns; the ORM refuses to load unknown values.
+            _normalize_incident_enum(
+                connection,
+                "contacted_authorities",
+                VALID_CONTACTED_AUTHORITIES,
+                CONTACTED_FALLBACKS,
+                None,
+                table_name="incident_followups",
+            )
+            _normalize_incident_enum(
+                connection,
+                "safety_sentiment",
+                VALID_SAFETY_SENTIMENTS,
+                SENTIMENT_FALLBACKS,
+                None,
+                table_name="incident_followups",
+            )
+            _normalize_reaction_values(connection, "incident_reactions")
+            _normalize_reaction_values(connection, "incident_comment_reactions")
         _seed_reward_ledger_if_empty(connection)
+        connection.execute(text(f"PRAGMA user_version = {SQLITE_SCHEMA_VERSION}"))
+
+
+def optimize_sqlite():
+    """Let SQLite refresh planner statistics for tables/indexes that need it."""
+    if not engine.url.drivername.startswith("sqlite"):
+        return
+
+    with engine.begin() as connection:
+        connection.execute(text("PRAGMA optimize"))
+
+
+def run_migrations():
+    """Create missing tables, apply the SQLite patches and refresh planner stats."""
+    from . import models  # noqa: F401  (registers every table on Base.metadata)
+
+    Base.metadata.create_all(bind=engine)
+    ensure_sqlite_schema()
+    optimize_sqlite()
@@ -1,20 +1,19 @@
 import os
+from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .db import Base, engine, ensure_sqlite_schema
+from .db import optimize_sqlite, run_migrations
+from .middleware import BodySizeLimitMiddleware
 from .routers import auth, incidents, notifications, role_requests, taxonomy, users, rewards
 
-# create tables on startup (for dev)
-Base.metadata.create_all(bind=engine)
-ensure_sqlite_schema()
-
 DEFAULT_CORS_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
-DEFAULT_CORS_REGEX = r"https?://(localhost|127\.0\.0\.1|\d{1,3}(?:\.\d{1,3}){3})(:\d+)?"
+DEFAULT_CORS_REGEX = r"https?://(?:localhost|127\.0\.0\.1|\d{1,3}(?:\.\d{1,3}){3})(?::\d+)?"
 
 
 def _parse_origin_list(raw: str | None) -> list[str]:
@@ -23,15 +22,41 @@ def _parse_origin_list(raw: str | None) -> list[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Production deploys can set RUN_MIGRATIONS_ON_STARTUP=0 and run `python -m backend.scripts.migrate`.
+    if os.getenv("RUN_MIGRATIONS_ON_STARTUP", "1") == "1":
+        run_migrations()
+
+    # Endpoints are sync (sync SQLAlchemy sessions), so AnyIO's worker threads bound concurrency.
+    threadpool_size = os.getenv("API_THREADPOOL_SIZE")
+    if threadpool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(threadpool_size)
+
+    yield
+
+    optimize_sqlite()
+
+
 app = FastAPI(
     title="Community Safety API",
     description="Community incident reporting / verification API (MVP)",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 # CORS: allow local frontend dev
 cors_origins = _parse_origin_list(os.getenv("CORS_ALLOW_ORIGINS")) or DEFAULT_CORS_ORIGINS
-cors_regex = os.getenv("CORS_ALLOW_ORIGIN_REGEX", DEFAULT_CORS_REGEX)
+# Set CORS_ALLOW_ORIGIN_REGEX="" in production so only the exact CORS_ALLOW_ORIGINS set is consulted.
+cors_regex = os.getenv("CORS_ALLOW_ORIGIN_REGEX", DEFAULT_CORS_REGEX) or None
+
+# Oversized uploads are refused before Starlette spools them to disk.
+# Added before CORS so the 413 still carries the CORS headers.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=incidents.MAX_COMMENT_UPLOAD_BODY_BYTES,
+    path_pattern=r"^/incidents/\d+/comments/upload$",
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,49 @@
+"""ASGI middleware that has to run before FastAPI parses the request."""
+
+from __future__ import annotations
+
+import re
+
+from fastapi import HTTPException, status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """Refuse request bodies over ``max_body_bytes`` on paths matching ``path_pattern``.
+
+    Starlette spools every multipart part to a temp file before the endpoint runs, so the cap
+    has to sit here: a declared Content-Length over the limit is rejected without reading the
+    body, and chunked bodies are counted as they stream in.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int, path_pattern: str) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.path_pattern = re.compile(path_pattern)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.path_pattern.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body is limited to {self.max_body_bytes // (1024 * 1024)} MB"
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_body_bytes:
+                response = JSONResponse({"detail": detail}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # FastAPI re-raises HTTPExceptions from body parsing unchanged.
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -1,23 +1,66 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, UniqueConstraint, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    case,
+    text,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from .db import Base
-from .services.rewards import determine_membership_tier
+from .services.rewards import TIER_LADDER, determine_membership_tier
+
+INCIDENT_TYPES = ("police", "community", "public-order")
+CONTACTED_AUTHORITIES = ("unknown", "none", "service-request", "911", "not-needed")
+SAFETY_SENTIMENTS = ("safe", "uneasy", "unsafe", "unsure")
+REACTION_VALUES = ("like", "unlike")
+
+
+def _string_enum(name: str, values, length: int) -> Enum:
+    """VARCHAR-backed enum: validated on write and CHECK-constrained on new tables."""
+    return Enum(
+        *values,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        validate_strings=True,
+        length=length,
+    )
 
 
 class Incident(Base):
     __tablename__ = "incidents"
+    __table_args__ = (
+        Index("ix_incidents_feed", "is_hidden", "incident_type", "created_at"),
+        Index("ix_incidents_reporter_created", "reporter_user_id", "created_at"),
+        # Covers the overview's posts/confirmed-posts counts without reading incident rows.
+        Index("ix_incidents_reporter_status", "reporter_user_id", "status"),
+        # Feed filters: walk one status/category newest-first instead of scanning all incidents.
+        Index("ix_incidents_status_created", "status", "created_at"),
+        Index("ix_incidents_category_created", "category", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # what happened
-    category = Column(String(100), index=True)
+    category = Column(String(100))
     description = Column(String(2000))
     incident_type = Column(
-        String(50),
+        _string_enum("incident_type", INCIDENT_TYPES, 50),
         index=True,
         default="community",
+        server_default=text("'community'"),
         nullable=False,
     )  # police | community | public-order
 
@@ -25,8 +68,12 @@ class Incident(Base):
     still_happening = Column(Boolean, default=None)
     feel_safe_now = Column(Boolean, default=None)
     police_seen = Column(Boolean, default=None)
-    contacted_authorities = Column(String(25), default="unknown")
-    safety_sentiment = Column(String(25), nullable=True)
+    contacted_authorities = Column(
+        _string_enum("incident_contacted_authorities", CONTACTED_AUTHORITIES, 25),
+        default="unknown",
+        server_default=text("'unknown'"),
+    )
+    safety_sentiment = Column(_string_enum("incident_safety_sentiment", SAFETY_SENTIMENTS, 25), nullable=True)
 
     # location
     location_text = Column(String(255))
@@ -34,35 +81,40 @@ class Incident(Base):
     lng = Column(Float, nullable=True)
 
     # verification status & scoring
-    status = Column(String(50), default="unverified")
-    credibility_score = Column(Float, default=0.4)
+    status = Column(String(50), default="unverified", server_default=text("'unverified'"))
+    credibility_score = Column(Float, default=0.4, server_default=text("0.4"))
     reporter_alias = Column(String(50), nullable=True)
     follow_up_due_at = Column(DateTime(timezone=True), nullable=True, index=True)
-    reporter_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    reward_points_awarded = Column(Integer, nullable=False, default=0)
-    verification_alert_sent = Column(Boolean, nullable=False, default=False)
-    is_hidden = Column(Boolean, nullable=False, default=False, index=True)
+    reporter_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    reward_points_awarded = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    verification_alert_sent = Column(Boolean, nullable=False, default=False, server_default=text("0"))
+    is_hidden = Column(Boolean, nullable=False, default=False, server_default=text("0"), index=True)
 
     # timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Collections raise on implicit access; routes must eager-load them (selectinload).
     follow_ups = relationship(
         "IncidentFollowUp",
         back_populates="incident",
         cascade="all, delete-orphan",
         order_by="IncidentFollowUp.created_at",
+        lazy="raise",
     )
     comments = relationship(
         "IncidentComment",
         back_populates="incident",
         cascade="all, delete-orphan",
-        order_by="IncidentComment.created_at",
+        # Newest first, as the API returns them.
+        order_by="(IncidentComment.created_at.desc(), IncidentComment.id.desc())",
+        lazy="raise",
     )
     reactions = relationship(
         "IncidentReaction",
         back_populates="incident",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
     media = relationship(
         "IncidentMedia",
@@ -85,9 +137,12 @@ class IncidentFollowUp(Base):
     status = Column(String(50), nullable=False)
     notes = Column(String(2000), nullable=True)
     still_happening = Column(Boolean, default=None)
-    contacted_authorities = Column(String(25), nullable=True)
+    contacted_authorities = Column(
+        _string_enum("followup_contacted_authorities", CONTACTED_AUTHORITIES, 25),
+        nullable=True,
+    )
     feel_safe_now = Column(Boolean, default=None)
-    safety_sentiment = Column(String(25), nullable=True)
+    safety_sentiment = Column(_string_enum("followup_safety_sentiment", SAFETY_SENTIMENTS, 25), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     created_by = Column(String(50), nullable=True)
 
@@ -96,37 +151,43 @@ class IncidentFollowUp(Base):
 
 class User(Base):
     __tablename__ = "users"
+    # One account per provider identity; the unique index also serves the /auth/oauth lookup.
+    __table_args__ = (Index("ix_users_provider_subject", "auth_provider", "provider_subject", unique=True),)
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=True)
     display_name = Column(String(100), nullable=True)
-    auth_provider = Column(String(50), nullable=False, default="password")
+    auth_provider = Column(String(50), nullable=False, default="password", server_default=text("'password'"))
     provider_subject = Column(String(255), nullable=True)
-    role = Column(String(25), nullable=False, default="resident", index=True)
-    reward_points = Column(Integer, nullable=False, default=0)
+    role = Column(String(25), nullable=False, default="resident", server_default=text("'resident'"), index=True)
+    reward_points = Column(Integer, nullable=False, default=0, server_default=text("0"))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    comments = relationship("IncidentComment", back_populates="user")
-    reactions = relationship("IncidentReaction", back_populates="user")
-    comment_reactions = relationship("IncidentCommentReaction", back_populates="user")
+    # UserProfile only serializes columns; opt in with selectinload() where a collection is needed.
+    comments = relationship("IncidentComment", back_populates="user", lazy="raise")
+    reactions = relationship("IncidentReaction", back_populates="user", lazy="raise")
+    comment_reactions = relationship("IncidentCommentReaction", back_populates="user", lazy="raise")
     reported_incidents = relationship(
         "Incident",
         back_populates="reporter",
         foreign_keys="Incident.reporter_user_id",
+        lazy="raise",
     )
     notifications = relationship(
         "Notification",
         back_populates="recipient",
         cascade="all, delete-orphan",
         order_by="Notification.created_at",
+        lazy="raise",
     )
     reward_ledger = relationship(
         "RewardLedgerEntry",
         back_populates="user",
         cascade="all, delete-orphan",
         order_by="RewardLedgerEntry.created_at.desc()",
+        lazy="raise",
     )
     role_requests = relationship(
         "RoleRequest",
@@ -134,20 +195,32 @@ class User(Base):
         cascade="all, delete-orphan",
         order_by="RoleRequest.created_at.desc()",
         foreign_keys="RoleRequest.user_id",
+        lazy="raise",
     )
     reviewed_role_requests = relationship(
         "RoleRequest",
         back_populates="reviewer",
         foreign_keys="RoleRequest.reviewer_id",
+        lazy="raise",
     )
 
-    @property
+    @hybrid_property
     def membership_tier(self) -> str:
         return determine_membership_tier(self.reward_points)
 
+    @membership_tier.inplace.expression
+    @classmethod
+    def _membership_tier_expression(cls):
+        # Same ladder as determine_membership_tier, so queries can filter or group by tier.
+        return case(
+            *[(cls.reward_points >= threshold, name) for name, threshold in reversed(TIER_LADDER[1:])],
+            else_=TIER_LADDER[0][0],
+        )
+
 
 class IncidentComment(Base):
     __tablename__ = "incident_comments"
+    __table_args__ = (Index("ix_comments_incident_hidden", "incident_id", "is_hidden", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=False, index=True)
@@ -155,7 +228,7 @@ class IncidentComment(Base):
     body = Column(String(2000), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    is_hidden = Column(Boolean, nullable=False, default=False, index=True)
+    is_hidden = Column(Boolean, nullable=False, default=False, server_default=text("0"), index=True)
 
     incident = relationship("Incident", back_populates="comments")
     user = relationship("User", back_populates="comments")
@@ -164,22 +237,28 @@ class IncidentComment(Base):
         back_populates="comment",
         cascade="all, delete-orphan",
         order_by="IncidentCommentAttachment.id",
+        lazy="raise",
     )
     reactions = relationship(
         "IncidentCommentReaction",
         back_populates="comment",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
 
 
 class IncidentReaction(Base):
     __tablename__ = "incident_reactions"
-    __table_args__ = (UniqueConstraint("incident_id", "user_id", name="uq_incident_reaction_user"),)
+    __table_args__ = (
+        UniqueConstraint("incident_id", "user_id", name="uq_incident_reaction_user"),
+        # Covers like/unlike counts and the narrow feed load without touching the table.
+        Index("ix_incident_reactions_agg", "incident_id", "value", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    value = Column(String(12), nullable=False)  # like | unlike
+    value = Column(_string_enum("incident_reaction_value", REACTION_VALUES, 12), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -194,7 +273,8 @@ class IncidentCommentAttachment(Base):
     comment_id = Column(Integer, ForeignKey("incident_comments.id"), nullable=False, index=True)
     media_type = Column(String(20), nullable=False)  # image | video
     content_type = Column(String(100), nullable=True)
-    data_base64 = Column(Text, nullable=False)
+    # Raw bytes (base64 only at the API boundary); only loaded when a query asks for it explicitly.
+    data = deferred(Column(LargeBinary, nullable=False))
     filename = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
@@ -203,12 +283,15 @@ class IncidentCommentAttachment(Base):
 
 class IncidentCommentReaction(Base):
     __tablename__ = "incident_comment_reactions"
-    __table_args__ = (UniqueConstraint("comment_id", "user_id", name="uq_comment_reaction_user"),)
+    __table_args__ = (
+        UniqueConstraint("comment_id", "user_id", name="uq_comment_reaction_user"),
+        Index("ix_comment_reactions_agg", "comment_id", "value", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     comment_id = Column(Integer, ForeignKey("incident_comments.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    value = Column(String(12), nullable=False)
+    value = Column(_string_enum("comment_reaction_value", REACTION_VALUES, 12), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -232,13 +315,18 @@ class IncidentMedia(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Inbox pages newest-first, and the unread filter/badge count, per recipient.
+        Index("ix_notifications_recipient_created", "recipient_id", "created_at"),
+        Index("ix_notifications_recipient_status_created", "recipient_id", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    recipient_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    recipient_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=True, index=True)
     message = Column(String(500), nullable=False)
-    category = Column(String(50), nullable=False, default="verification")
-    status = Column(String(20), nullable=False, default="unread")
+    category = Column(String(50), nullable=False, default="verification", server_default=text("'verification'"))
+    status = Column(String(20), nullable=False, default="unread", server_default=text("'unread'"))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     read_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -252,7 +340,7 @@ class RoleRequest(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     requested_role = Column(String(25), nullable=False)
-    status = Column(String(20), nullable=False, default="pending")
+    status = Column(String(20), nullable=False, default="pending", server_default=text("'pending'"))
     justification = Column(String(500), nullable=True)
     reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     reviewer_notes = Column(String(500), nullable=True)
@@ -273,15 +361,25 @@ class RoleRequest(Base):
 
 class RewardLedgerEntry(Base):
     __tablename__ = "reward_ledger"
+    __table_args__ = (
+        # A user's ledger newest-first, and the pending-redemption queue oldest-first.
+        Index("ix_reward_ledger_user_created", "user_id", "created_at"),
+        Index("ix_reward_ledger_queue", "source", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     delta = Column(Integer, nullable=False)
-    source = Column(String(50), nullable=False, default="manual")
+    source = Column(String(50), nullable=False, default="manual", server_default=text("'manual'"))
     description = Column(String(255), nullable=False)
     partner_id = Column(String(50), nullable=True)
     partner_name = Column(String(100), nullable=True)
-    status = Column(String(25), nullable=False, default="posted")  # posted | pending | fulfilled | cancelled
+    status = Column(
+        String(25),
+        nullable=False,
+        default="posted",
+        server_default=text("'posted'"),
+    )  # posted | pending | fulfilled | cancelled
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     user = relationship("User", back_populates="reward_ledger")
@@ -1,12 +1,20 @@
-from typing import Any, Dict, Optional
+import json
+import os
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from jose import JWTError as JoseJWTError, jwt as jose_jwt
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
-from ..db import get_db
-from ..security import create_access_token, get_current_user, get_password_hash, verify_password
+from ..db import UPSERT_INSERTS, get_db
+from ..security import create_access_token, get_current_user
+from ..services.passwords import get_password_hash, password_needs_rehash, verify_password
 from ..services import role_requests as role_request_service
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -22,17 +30,112 @@ ROLE_ALIASES = {
     "law_enforcement": "officer",
     "officer": "officer",
 }
+# Canonical roles map to themselves, so resolving a selection is one dict lookup.
+ROLE_LOOKUP = {**{role: role for role in PUBLIC_ROLES}, **ROLE_ALIASES}
+
+# Built once so SQLAlchemy's compiled-statement cache is hit on every auth request.
+SELECT_USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam("email"))
+SELECT_USER_BY_PROVIDER = select(models.User).where(
+    models.User.auth_provider == bindparam("provider"),
+    models.User.provider_subject == bindparam("subject"),
+)
+OAUTH_PROVIDERS = ("google", "apple")
+# Providers with a JWKS URL get signature-verified id_tokens; the rest keep the development stub parsing.
+OAUTH_JWKS_URLS = {
+    provider: os.getenv(f"OAUTH_{provider.upper()}_JWKS_URL") for provider in OAUTH_PROVIDERS
+}
+OAUTH_AUDIENCES = {
+    provider: os.getenv(f"OAUTH_{provider.upper()}_AUDIENCE") for provider in OAUTH_PROVIDERS
+}
+# Google signs with either spelling of its issuer; OAUTH_<PROVIDER>_ISSUER overrides the default.
+OAUTH_DEFAULT_ISSUERS = {
+    "google": ("https://accounts.google.com", "accounts.google.com"),
+    "apple": ("https://appleid.apple.com",),
+}
+OAUTH_ISSUERS = {
+    provider: (
+        (os.environ[f"OAUTH_{provider.upper()}_ISSUER"],)
+        if os.getenv(f"OAUTH_{provider.upper()}_ISSUER")
+        else OAUTH_DEFAULT_ISSUERS[provider]
+    )
+    for provider in OAUTH_PROVIDERS
+}
+# Without a pinned audience, any token the provider issued to another client app would log in here.
+_unpinned_providers = [
+    provider for provider in OAUTH_PROVIDERS if OAUTH_JWKS_URLS[provider] and not OAUTH_AUDIENCES[provider]
+]
+if _unpinned_providers:
+    raise RuntimeError(
+        "Set "
+        + ", ".join(f"OAUTH_{provider.upper()}_AUDIENCE" for provider in _unpinned_providers)
+        + " to the app's client id whenever the matching JWKS URL is configured."
+    )
+OAUTH_JWKS_TTL_SECONDS = 3600
+# An unknown kid triggers at most one refetch per this interval, so forged kids cannot hammer the provider.
+OAUTH_JWKS_MIN_REFETCH_SECONDS = 60
+
+_jwks_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_jwks_lock = threading.Lock()
 
 
 def _normalize_email(email: str) -> str:
+    # str.lower() already has a C fast path for ASCII; str.translate with a table is ~10x slower.
     return email.strip().lower()
 
 
-def _parse_oauth_claims(_provider: str, id_token: str) -> Dict[str, Any]:
+def _provider_jwks(provider: str, jwks_url: str, refresh: bool = False) -> Dict[str, Any]:
+    now = time.monotonic()
+    with _jwks_lock:
+        cached = _jwks_cache.get(provider)
+    if cached and cached[1] > now:
+        fetched_at = cached[1] - OAUTH_JWKS_TTL_SECONDS
+        if not refresh or now - fetched_at < OAUTH_JWKS_MIN_REFETCH_SECONDS:
+            return cached[0]
+
+    try:
+        with urllib.request.urlopen(jwks_url, timeout=5) as response:
+            jwks = json.load(response)
+    except (OSError, ValueError):
+        if cached:
+            return cached[0]
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Identity provider unavailable")
+
+    with _jwks_lock:
+        _jwks_cache[provider] = (jwks, now + OAUTH_JWKS_TTL_SECONDS)
+    return jwks
+
+
+def _verify_oauth_token(provider: str, raw_token: str, jwks_url: str) -> Dict[str, Any]:
+    jwks = _provider_jwks(provider, jwks_url)
+    try:
+        kid = jose_jwt.get_unverified_header(raw_token).get("kid")
+    except JoseJWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid id_token")
+    if kid and kid not in {key.get("kid") for key in jwks.get("keys", [])}:
+        # Providers publish rotated keys before the cached set expires; look once more before rejecting.
+        jwks = _provider_jwks(provider, jwks_url, refresh=True)
+    try:
+        return jose_jwt.decode(
+            raw_token,
+            jwks,
+            algorithms=["RS256"],
+            audience=OAUTH_AUDIENCES[provider],
+            issuer=OAUTH_ISSUERS[provider],
+            options={"verify_at_hash": False},
+        )
+    except JoseJWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid id_token")
+
+
+def _parse_oauth_claims(provider: str, id_token: str) -> Dict[str, Any]:
     raw_token = (id_token or "").strip()
     if not raw_token:
         return {}
 
+    jwks_url = OAUTH_JWKS_URLS.get(provider)
+    if jwks_url:
+        return _verify_oauth_token(provider, raw_token, jwks_url)
+
     if raw_token.count(".") >= 2:
         try:
             claims = jose_jwt.get_unverified_claims(raw_token)
@@ -58,14 +161,13 @@ def _extract_display_name_from_claims(claims: Dict[str, Any]) -> Optional[str]:
         return name_claim.strip()
 
     given = claims.get("given_name")
+    given = given.strip() if isinstance(given, str) else ""
     family = claims.get("family_name")
-    parts = [
-        part.strip()
-        for part in (given, family)
-        if isinstance(part, str) and part and part.strip()
-    ]
-    if parts:
-        return " ".join(parts)
+    family = family.strip() if isinstance(family, str) else ""
+    if given and family:
+        return f"{given} {family}"
+    if given or family:
+        return given or family
 
     preferred = claims.get("preferred_username")
     if isinstance(preferred, str) and preferred.strip():
@@ -77,11 +179,61 @@ def _extract_display_name_from_claims(claims: Dict[str, Any]) -> Optional[str]:
 def _resolve_requested_role(selection: Optional[str]) -> str:
     if not selection:
         return "resident"
-    normalized = selection.strip().lower()
-    normalized = ROLE_ALIASES.get(normalized, normalized)
-    if normalized in PUBLIC_ROLES:
-        return normalized
-    return "resident"
+    return ROLE_LOOKUP.get(selection.strip().lower(), "resident")
+
+
+def _upsert_provider_user(
+    db: Session,
+    provider: str,
+    subject: str,
+    email: str,
+    display_name: str,
+    role: str,
+) -> Tuple[Optional[models.User], bool]:
+    """Insert or refresh the account for a provider identity in one statement.
+
+    Returns ``(user, created)``, or ``(None, False)`` when the upsert cannot apply
+    (the email already belongs to another account, or the dialect has no upsert).
+    """
+    dialect_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        return None, False
+
+    statement = dialect_insert(models.User).values(
+        email=email,
+        display_name=display_name,
+        auth_provider=provider,
+        provider_subject=subject,
+        role=role,
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[models.User.auth_provider, models.User.provider_subject],
+        set_={
+            "email": statement.excluded.email,
+            "display_name": statement.excluded.display_name,
+            "updated_at": func.now(),
+        },
+    ).returning(models.User)
+    try:
+        user = db.execute(statement, execution_options={"populate_existing": True}).scalar_one()
+    except DBAPIError:
+        db.rollback()
+        return None, False
+    # Only the conflict branch stamps updated_at, so NULL marks a freshly inserted account.
+    return user, user.updated_at is None
+
+
+def _token_response(user: models.User) -> schemas.TokenResponse:
+    token = create_access_token(user)
+    return schemas.TokenResponse(access_token=token, user=user)  # type: ignore[arg-type]
+
+
+def _commit_token_response(db: Session, user: models.User) -> schemas.TokenResponse:
+    """Serialize before committing: every profile field is known after the flush, so no refresh SELECT."""
+    db.flush()
+    response = _token_response(user)
+    db.commit()
+    return response
 
 
 def _apply_role_selection(
@@ -102,7 +254,7 @@ def _apply_role_selection(
 @router.post("/register", response_model=schemas.TokenResponse, status_code=status.HTTP_201_CREATED)
 def register_user(payload: schemas.AuthEmailRegister, db: Session = Depends(get_db)):
     email = _normalize_email(payload.email)
-    existing = db.query(models.User).filter(models.User.email == email).first()
+    existing = db.execute(SELECT_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
@@ -119,30 +271,26 @@ def register_user(payload: schemas.AuthEmailRegister, db: Session = Depends(get_
         role=assigned_role,
     )
     db.add(user)
-    db.flush()
-
     if requires_approval:
-        role_request_service.queue_role_request(
-            db,
-            user,
-            requested_role,
-            payload.role_justification,
-        )
-
-    db.commit()
-    db.refresh(user)
+        # A new account has no pending request to refresh; both rows go out in the commit flush.
+        db.add(role_request_service.build_role_request(user, requested_role, payload.role_justification))
 
-    token = create_access_token(user)
-    return schemas.TokenResponse(access_token=token, user=user)  # type: ignore[arg-type]
+    return _commit_token_response(db, user)
 
 
 @router.post("/login", response_model=schemas.TokenResponse)
 def login_user(payload: schemas.AuthEmailLogin, db: Session = Depends(get_db)):
     email = _normalize_email(payload.email)
-    user = db.query(models.User).filter(models.User.email == email).first()
+    user = db.execute(SELECT_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
     if not user or not verify_password(payload.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    changed = False
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(payload.password)
+        db.add(user)
+        changed = True
+
     if payload.role and user.role == "resident":
         requested_role = _resolve_requested_role(payload.role)
         if requested_role != "resident":
@@ -152,35 +300,56 @@ def login_user(payload: schemas.AuthEmailLogin, db: Session = Depends(get_db)):
                 requested_role,
                 payload.role_justification,
             )
-            db.commit()
-            db.refresh(user)
+            changed = True
 
-    token = create_access_token(user)
-    return schemas.TokenResponse(access_token=token, user=user)  # type: ignore[arg-type]
+    if changed:
+        return _commit_token_response(db, user)
+    return _token_response(user)
+
+
+def _verified_identity(claims: Dict[str, Any]) -> Tuple[str, str]:
+    """Subject and email from a signature-verified id_token; the request body is never consulted.
+
+    The email links the login to an existing account, so the provider must vouch for it.
+    """
+    subject = claims.get("sub")
+    if not isinstance(subject, str) or not subject:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid id_token")
+    email = claims.get("email")
+    if not isinstance(email, str) or not email.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email is required")
+    # Apple sends the flag as the string "true".
+    if claims.get("email_verified") not in (True, "true"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Provider email is not verified")
+    return subject, _normalize_email(email)
+
+
+def _unverified_email(payload: schemas.AuthOAuthPayload, claims: Dict[str, Any]) -> Optional[str]:
+    # Development stub parsing only: nothing here is trusted, so the client may supply the email.
+    if payload.email:
+        return _normalize_email(payload.email)
+    claim_email = claims.get("email")
+    if isinstance(claim_email, str) and claim_email.strip():
+        return _normalize_email(claim_email)
+    emails_claim = claims.get("emails")
+    if isinstance(emails_claim, list):
+        for item in emails_claim:
+            if isinstance(item, str) and "@" in item:
+                return _normalize_email(item)
+    return None
 
 
 @router.post("/oauth", response_model=schemas.TokenResponse)
 def login_with_provider(payload: schemas.AuthOAuthPayload, db: Session = Depends(get_db)):
-    # NOTE: For production you must verify the provider id_token with the provider's public keys.
     raw_token = payload.id_token.strip()
     if not raw_token:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="id_token required")
 
     claims = _parse_oauth_claims(payload.provider, raw_token)
-    subject = str(claims.get("sub") or raw_token)
-
-    email = _normalize_email(payload.email) if payload.email else None
-    if not email:
-        claim_email = claims.get("email")
-        if isinstance(claim_email, str) and claim_email.strip():
-            email = _normalize_email(claim_email)
-        else:
-            emails_claim = claims.get("emails")
-            if isinstance(emails_claim, list):
-                for item in emails_claim:
-                    if isinstance(item, str) and "@" in item:
-                        email = _normalize_email(item)
-                        break
+    if OAUTH_JWKS_URLS.get(payload.provider):
+        subject, email = _verified_identity(claims)
+    else:
+        subject, email = str(claims.get("sub") or raw_token), _unverified_email(payload, claims)
 
     if not email:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email is required")
@@ -194,20 +363,22 @@ def login_with_provider(payload: schemas.AuthOAuthPayload, db: Session = Depends
         display_name = email.split("@")[0]
 
     requested_role = _resolve_requested_role(payload.role)
+    requires_approval = role_request_service.requires_manual_approval(requested_role)
+    assigned_role = requested_role if not requires_approval else "resident"
 
-    user = (
-        db.query(models.User)
-        .filter(models.User.auth_provider == payload.provider, models.User.provider_subject == subject)
-        .first()
-    )
+    user, created = _upsert_provider_user(db, payload.provider, subject, email, display_name, assigned_role)
 
+    if not user:
+        user = (
+            db.execute(SELECT_USER_BY_PROVIDER, {"provider": payload.provider, "subject": subject})
+            .scalars()
+            .first()
+        )
     if not user:
         # Fallback: try linking by email for returning users.
-        user = db.query(models.User).filter(models.User.email == email).first()
+        user = db.execute(SELECT_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
     if not user:
-        requires_approval = role_request_service.requires_manual_approval(requested_role)
-        assigned_role = requested_role if not requires_approval else "resident"
         user = models.User(
             email=email,
             display_name=display_name,
@@ -216,15 +387,8 @@ def login_with_provider(payload: schemas.AuthOAuthPayload, db: Session = Depends
             role=assigned_role,
         )
         db.add(user)
-        db.flush()
-        if requires_approval:
-            role_request_service.queue_role_request(
-                db,
-                user,
-                requested_role,
-                payload.role_justification,
-            )
-    else:
+        created = True
+    elif not created:
         # Update provider metadata if missing.
         if user.email != email:
             user.email = email
@@ -233,20 +397,20 @@ def login_with_provider(payload: schemas.AuthOAuthPayload, db: Session = Depends
         user.auth_provider = payload.provider
         if display_name:
             user.display_name = display_name
-        if payload.role and requested_role != "resident" and user.role == "resident":
-            _apply_role_selection(
-                db,
-                user,
-                requested_role,
-                payload.role_justification,
-            )
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    if created:
+        if requires_approval:
+            db.add(role_request_service.build_role_request(user, requested_role, payload.role_justification))
+    elif payload.role and requested_role != "resident" and user.role == "resident":
+        _apply_role_selection(
+            db,
+            user,
+            requested_role,
+            payload.role_justification,
+        )
 
-    token = create_access_token(user)
-    return schemas.TokenResponse(access_token=token, user=user)  # type: ignore[arg-type]
+    db.add(user)
+    return _commit_token_response(db, user)
 
 
 @router.get("/me", response_model=schemas.UserProfile)
@@ -1,16 +1,19 @@
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, get_args
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, Response, UploadFile, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, select, tuple_, update
 from sqlalchemy.orm import Session, selectinload
 
 from .. import models, schemas
-from ..db import get_db
-from ..security import get_current_user, optional_current_user
+from ..db import UPSERT_INSERTS, get_db
+from ..security import get_current_user, optional_current_user, sign_resource_path, verify_resource_signature
+from ..services.cache import MISSING, TTLCache, clear_on_commit
 from ..services.locations import apply_known_location_coordinates
+from ..services.media import decode_base64_payload
 from ..services.rewards import reward_target_for_status
-from ..services.ledger import record_reward_entry
+from ..services.ledger import credit_reward_points
 
 router = APIRouter(
     prefix="/incidents",
@@ -19,12 +22,64 @@ router = APIRouter(
 
 FOLLOW_UP_INITIAL_MINUTES = 30
 FOLLOW_UP_EXTENDED_MINUTES = 120
-RESOLVED_STATUSES = {"official-confirmed", "resolved"}
+RESOLVED_STATUSES = ("official-confirmed", "resolved")
 MODERATOR_ROLES = {"admin", "officer"}
 APPROVER_ROLES = {"admin", "staff", "officer"}
-ALLOWED_STATUS_UPDATES = {"unverified", "community-confirmed", "official-confirmed", "resolved"}
-EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ALLOWED_STATUS_UPDATES = frozenset(get_args(schemas.IncidentStatus))
+NO_REACTIONS: Tuple[int, int, Optional[str]] = (0, 0, None)
+# Plain attachment URLs must be revalidated: a hidden or removed attachment has to stop
+# showing up, so browsers re-ask with the ETag and usually get a bodyless 304. Signed URLs
+# change every hour and only ever reach moderators, so those copies can be kept as-is.
+ATTACHMENT_CACHE_CONTROL = "private, no-cache"
+SIGNED_ATTACHMENT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+# Moderators get signed attachment URLs (hidden comments are otherwise 404 without a bearer
+# header). Expiry is rounded to the hour so the URL, and the browser's cached copy, stay stable.
+ATTACHMENT_URL_TTL_SECONDS = 3600
+# Per-comment upload limits; the web and mobile composers allow three attachments.
+MAX_COMMENT_ATTACHMENTS = 3
+MAX_COMMENT_ATTACHMENT_BYTES = 10 * 1024 * 1024
+# Whole multipart body for /comments/upload, enforced by BodySizeLimitMiddleware before parsing;
+# the slack covers the comment text and the part headers.
+MAX_COMMENT_UPLOAD_BODY_BYTES = MAX_COMMENT_ATTACHMENTS * MAX_COMMENT_ATTACHMENT_BYTES + 64 * 1024
 VERIFIER_ROLES = {"admin", "staff", "officer"}
+UNSCORED_AUTHORITY_CONTACTS = frozenset({None, "", "unknown", "none"})
+STATS_CACHE_SECONDS = 30
+INCIDENT_FEED_CACHE_SECONDS = 10
+INCIDENT_DETAIL_CACHE_SECONDS = 10
+VERIFIER_CACHE_SECONDS = 300
+
+# Pre-aggregated /stats payload: dropped whenever an incident commit lands, and never kept
+# past the moment the next follow-up falls due (active_follow_up depends on the clock).
+_stats_snapshot = TTLCache(ttl_seconds=STATS_CACHE_SECONDS, max_entries=1)
+clear_on_commit(_stats_snapshot, models.Incident)
+
+# Ids of users who receive verification requests; roles only change through ORM commits
+# (role approvals, admin edits), which drop the entry.
+_verifier_ids = TTLCache(ttl_seconds=VERIFIER_CACHE_SECONDS, max_entries=1)
+clear_on_commit(_verifier_ids, models.User)
+
+# Everything IncidentPublic renders; a committed write to any of these drops the page caches.
+_INCIDENT_PAGE_MODELS = (
+    models.Incident,
+    models.IncidentFollowUp,
+    models.IncidentMedia,
+    models.IncidentComment,
+    models.IncidentCommentAttachment,
+    models.IncidentReaction,
+    models.IncidentCommentReaction,
+    models.User,
+)
+
+# Serialized anonymous feed pages keyed by their filters; signed-in viewers see their own
+# reactions and moderators see hidden content, so only anonymous requests use it.
+_INCIDENT_FEED_ADAPTER = TypeAdapter(List[schemas.IncidentPublic])
+_anonymous_feed_cache = TTLCache(ttl_seconds=INCIDENT_FEED_CACHE_SECONDS)
+clear_on_commit(_anonymous_feed_cache, *_INCIDENT_PAGE_MODELS)
+
+# Serialized incident detail pages keyed by (incident, viewer), since the viewer's reactions
+# and hidden-content access are part of the payload.
+_incident_detail_cache = TTLCache(ttl_seconds=INCIDENT_DETAIL_CACHE_SECONDS, max_entries=512)
+clear_on_commit(_incident_detail_cache, *_INCIDENT_PAGE_MODELS)
 
 
 def _model_dump(payload):
@@ -39,15 +94,18 @@ def _now_utc() -> datetime:
 
 def _calculate_credibility(payload: schemas.IncidentCreate) -> float:
     """Very lightweight heuristic that rewards structured signals."""
-    score = 0.35
-    if payload.location_text:
-        score += 0.15
-    prompt_answers = [payload.still_happening, payload.police_seen, payload.feel_safe_now]
-    score += 0.12 * sum(1 for item in prompt_answers if item is not None)
-    if payload.safety_sentiment:
-        score += 0.08
-    if payload.contacted_authorities and payload.contacted_authorities not in {"unknown", "none"}:
-        score += 0.12
+    score = (
+        0.35
+        + 0.15 * bool(payload.location_text)
+        + 0.12
+        * (
+            (payload.still_happening is not None)
+            + (payload.police_seen is not None)
+            + (payload.feel_safe_now is not None)
+        )
+        + 0.08 * bool(payload.safety_sentiment)
+        + 0.12 * (payload.contacted_authorities not in UNSCORED_AUTHORITY_CONTACTS)
+    )
     return max(0.2, min(0.95, score))
 
 
@@ -57,83 +115,68 @@ def _notify_verifiers(db: Session, incident: models.Incident, reporter: Optional
     if incident.verification_alert_sent:
         return
 
-    recipients = (
-        db.query(models.User)
-        .filter(models.User.role.in_(tuple(VERIFIER_ROLES)))
-        .all()
-    )
-    if not recipients:
+    recipient_ids = _verifier_recipient_ids(db)
+    if not recipient_ids:
         return
 
     location_hint = f" near {incident.location_text}" if incident.location_text else ""
-    for recipient in recipients:
-        message = (
-            f"Incident #{incident.id} from {reporter.display_name or reporter.email}"
-            f"{location_hint} needs verification."
-        )
-        db.add(
-            models.Notification(
-                recipient_id=recipient.id,
-                incident_id=incident.id,
-                message=message,
-                category="verification",
-            )
-        )
+    message = (
+        f"Incident #{incident.id} from {reporter.display_name or reporter.email}"
+        f"{location_hint} needs verification."
+    )
+    db.execute(
+        insert(models.Notification),
+        [
+            {
+                "recipient_id": recipient_id,
+                "incident_id": incident.id,
+                "message": message,
+                "category": "verification",
+            }
+            for recipient_id in recipient_ids
+        ],
+    )
 
     incident.verification_alert_sent = True
 
 
+def _verifier_recipient_ids(db: Session) -> List[int]:
+    recipient_ids = _verifier_ids.get("ids")
+    if recipient_ids is MISSING:
+        recipient_ids = [
+            user_id
+            for (user_id,) in db.query(models.User.id).filter(models.User.role.in_(tuple(VERIFIER_ROLES)))
+        ]
+        _verifier_ids.set("ids", recipient_ids)
+    return recipient_ids
+
+
 def _apply_reward_progress(db: Session, incident: models.Incident) -> None:
     if not incident.reporter_user_id:
         return
 
     target_points = reward_target_for_status(incident.status, incident.credibility_score)
-    already_awarded = incident.reward_points_awarded or 0
-    if target_points <= already_awarded:
-        return
-
-    reporter = incident.reporter
-    if not reporter:
-        reporter = (
-            db.query(models.User)
-            .filter(models.User.id == incident.reporter_user_id)
-            .first()
-        )
-        if not reporter:
-            return
-        incident.reporter = reporter
-
-    delta = target_points - already_awarded
+    delta = target_points - (incident.reward_points_awarded or 0)
     if delta <= 0:
         return
 
     description = f"Incident #{incident.id} status → {incident.status}"
-    try:
-        record_reward_entry(
-            db,
-            reporter,
-            delta,
-            source="incident",
-            description=description,
-        )
-    except ValueError:
-        # If the ledger helper rejected the entry, skip credit updates for now
+    entry = credit_reward_points(
+        db,
+        incident.reporter_user_id,
+        delta,
+        source="incident",
+        description=description,
+    )
+    if entry is None:
         return
-
     incident.reward_points_awarded = target_points
-    db.add(incident)
 
 
 def _can_view_hidden(user: Optional[models.User]) -> bool:
     return bool(user and user.role in MODERATOR_ROLES)
 
 
-def _prune_hidden_comments(incident: models.Incident, current_user: Optional[models.User]) -> None:
-    if _can_view_hidden(current_user):
-        return
-    incident.comments = [comment for comment in incident.comments if not comment.is_hidden]
-
-
 def _assert_moderator(user: Optional[models.User]) -> models.User:
     if not user or user.role not in MODERATOR_ROLES:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Moderator permissions required")
@@ -146,92 +189,186 @@ def _assert_approver(user: Optional[models.User]) -> models.User:
     return user
 
 
-def _populate_interaction_metadata(incident: models.Incident, current_user: Optional[models.User]) -> None:
-    likes = 0
-    unlikes = 0
-    viewer = None
-    for reaction in incident.reactions:
-        if reaction.value == "like":
-            likes += 1
-        elif reaction.value == "unlike":
-            unlikes += 1
-        if current_user and reaction.user_id == current_user.id:
-            viewer = reaction.value
-
-    incident.likes_count = likes
-    incident.unlikes_count = unlikes
-    incident.viewer_reaction = viewer
-
-    try:
-        incident.comments.sort(key=lambda item: item.created_at or EPOCH, reverse=True)
-    except AttributeError:
-        sorted_comments = sorted(incident.comments, key=lambda item: item.created_at or EPOCH, reverse=True)
-        incident.comments = sorted_comments  # type: ignore[assignment]
-
-    for comment in incident.comments:
-        _populate_comment_metadata(comment, current_user)
-    _prune_hidden_comments(incident, current_user)
-
-
-def _populate_comment_metadata(comment: models.IncidentComment, current_user: Optional[models.User]) -> None:
-    likes = 0
-    unlikes = 0
-    viewer = None
-    for reaction in comment.reactions:
-        if reaction.value == "like":
-            likes += 1
-        elif reaction.value == "unlike":
-            unlikes += 1
-        if current_user and reaction.user_id == current_user.id:
-            viewer = reaction.value
-
-    comment.likes_count = likes
-    comment.unlikes_count = unlikes
-    comment.viewer_reaction = viewer
+def _populate_interaction_metadata(
+    db: Session,
+    incidents: List[models.Incident],
+    current_user: Optional[models.User],
+) -> None:
+    summaries = _reaction_summaries(
+        db,
+        models.IncidentReaction,
+        models.IncidentReaction.incident_id,
+        [incident.id for incident in incidents],
+        current_user,
+    )
+    for incident in incidents:
+        incident.likes_count, incident.unlikes_count, incident.viewer_reaction = summaries.get(
+            incident.id, NO_REACTIONS
+        )
 
+    _populate_comment_metadata(
+        db,
+        [comment for incident in incidents for comment in incident.comments],
+        current_user,
+    )
 
-def _reaction_status(db: Session, incident_id: int, current_user: Optional[models.User]) -> schemas.IncidentReactionStatus:
+
+def _populate_comment_metadata(
+    db: Session,
+    comments: List[models.IncidentComment],
+    current_user: Optional[models.User],
+) -> None:
+    summaries = _reaction_summaries(
+        db,
+        models.IncidentCommentReaction,
+        models.IncidentCommentReaction.comment_id,
+        [comment.id for comment in comments],
+        current_user,
+    )
+    signed_until = None
+    if _can_view_hidden(current_user):
+        now = int(_now_utc().timestamp())
+        signed_until = (now // ATTACHMENT_URL_TTL_SECONDS + 2) * ATTACHMENT_URL_TTL_SECONDS
+    for comment in comments:
+        comment.likes_count, comment.unlikes_count, comment.viewer_reaction = summaries.get(
+            comment.id, NO_REACTIONS
+        )
+        for attachment in comment.attachments:
+            path = _attachment_path(comment.incident_id, comment.id, attachment.id)
+            if signed_until:
+                path = f"{path}?expires={signed_until}&signature={sign_resource_path(path, signed_until)}"
+            attachment.url = path
+
+
+def _attachment_path(incident_id: int, comment_id: int, attachment_id: int) -> str:
+    return f"{router.prefix}/{incident_id}/comments/{comment_id}/attachments/{attachment_id}"
+
+
+def _reaction_summaries(
+    db: Session,
+    reaction_model,
+    parent_column,
+    parent_ids: List[int],
+    current_user: Optional[models.User],
+) -> Dict[int, Tuple[int, int, Optional[str]]]:
+    """Map parent id -> (likes, unlikes, viewer reaction) with one grouped query.
+
+    Counting in SQL keeps individual reaction rows out of the feed; the (parent, value, user)
+    covering indexes answer it without touching the reaction tables.
+    """
+    summaries: Dict[int, Tuple[int, int, Optional[str]]] = {}
+    if not parent_ids:
+        return summaries
+    viewer_id = current_user.id if current_user else None
     rows = (
-        db.query(models.IncidentReaction.value, func.count(models.IncidentReaction.id))
-        .filter(models.IncidentReaction.incident_id == incident_id)
-        .group_by(models.IncidentReaction.value)
-        .all()
+        db.query(
+            parent_column,
+            reaction_model.value,
+            func.count(),
+            func.count().filter(reaction_model.user_id == viewer_id),
+        )
+        .filter(parent_column.in_(parent_ids))
+        .group_by(parent_column, reaction_model.value)
     )
-    counts = {value: count for value, count in rows}
-    viewer = None
-    if current_user:
-        record = (
-            db.query(models.IncidentReaction)
-            .filter(
-                models.IncidentReaction.incident_id == incident_id,
-                models.IncidentReaction.user_id == current_user.id,
+    for parent_id, value, count, viewer_count in rows:
+        likes, unlikes, viewer = summaries.get(parent_id, NO_REACTIONS)
+        if value == "like":
+            likes += count
+        elif value == "unlike":
+            unlikes += count
+        if viewer_count:
+            viewer = value
+        summaries[parent_id] = (likes, unlikes, viewer)
+    return summaries
+
+
+def _reaction_status(db: Session, incident_id: int, current_user: Optional[models.User]) -> schemas.IncidentReactionStatus:
+    likes, unlikes, viewer = _reaction_summaries(
+        db,
+        models.IncidentReaction,
+        models.IncidentReaction.incident_id,
+        [incident_id],
+        current_user,
+    ).get(incident_id, NO_REACTIONS)
+    return schemas.IncidentReactionStatus(likes_count=likes, unlikes_count=unlikes, viewer_reaction=viewer)
+
+
+def _write_reaction(db: Session, reaction_model, parent_key: str, parent_id: int, user_id: int, action: str) -> None:
+    """Apply a like/unlike/clear for one user without reading the existing reaction first."""
+    owner = {parent_key: parent_id, "user_id": user_id}
+    if action == "clear":
+        db.execute(delete(reaction_model).filter_by(**owner))
+        return
+
+    dialect_insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(reaction_model).values(**owner, value=action)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[parent_key, "user_id"],
+                set_={"value": stmt.excluded.value, "updated_at": func.now()},
+                where=reaction_model.value != stmt.excluded.value,
             )
-            .first()
         )
-        if record:
-            viewer = record.value
+        return
 
-    return schemas.IncidentReactionStatus(
-        likes_count=counts.get("like", 0),
-        unlikes_count=counts.get("unlike", 0),
-        viewer_reaction=viewer,
-    )
+    reaction = db.query(reaction_model).filter_by(**owner).first()
+    if reaction:
+        reaction.value = action
+    else:
+        db.add(reaction_model(**owner, value=action))
+    # The session does not autoflush, and callers count reactions in SQL before committing.
+    db.flush()
+
+
+# Loader options are immutable, so they are built once here rather than on every request;
+# SQLAlchemy's compiled cache already reuses the SQL for each filter combination.
+_COMMENT_DETAIL_OPTIONS = (
+    selectinload(models.IncidentComment.user),
+    # Metadata only: the deferred bytes are served by get_comment_attachment.
+    selectinload(models.IncidentComment.attachments),
+)
+_INCIDENT_DETAIL_OPTIONS = (
+    selectinload(models.Incident.reporter),
+    selectinload(models.Incident.follow_ups),
+    selectinload(models.Incident.media),
+    selectinload(models.Incident.comments).options(*_COMMENT_DETAIL_OPTIONS),
+)
+# Viewers without moderation rights never see hidden comments, so they are filtered in the
+# eager load (via ix_comments_incident_hidden) instead of being fetched and dropped in Python.
+_PUBLIC_INCIDENT_DETAIL_OPTIONS = (
+    *_INCIDENT_DETAIL_OPTIONS[:-1],
+    selectinload(
+        models.Incident.comments.and_(models.IncidentComment.is_hidden.is_(False))
+    ).options(*_COMMENT_DETAIL_OPTIONS),
+)
+
+
+def _incident_detail_query(db: Session, current_user: Optional[models.User]):
+    """Incident query that eager-loads every relationship IncidentPublic serializes for this viewer."""
+    if _can_view_hidden(current_user):
+        return db.query(models.Incident).options(*_INCIDENT_DETAIL_OPTIONS)
+    return db.query(models.Incident).options(*_PUBLIC_INCIDENT_DETAIL_OPTIONS)
+
+
+def _reload_incident(db: Session, incident_id: int, current_user: Optional[models.User]) -> models.Incident:
+    incident = _incident_detail_query(db, current_user).filter(models.Incident.id == incident_id).first()
+    if not incident:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    _populate_interaction_metadata(db, [incident], current_user)
+    return incident
 
 
 def _reload_comment(db: Session, comment_id: int, current_user: Optional[models.User]) -> models.IncidentComment:
     comment = (
         db.query(models.IncidentComment)
-        .options(
-            selectinload(models.IncidentComment.user),
-            selectinload(models.IncidentComment.attachments),
-            selectinload(models.IncidentComment.reactions),
-        )
+        .options(*_COMMENT_DETAIL_OPTIONS)
         .filter(models.IncidentComment.id == comment_id)
         .first()
     )
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
-    _populate_comment_metadata(comment, current_user)
+    _populate_comment_metadata(db, [comment], current_user)
     return comment
 
 
@@ -244,25 +381,18 @@ def list_incidents(
     incident_type: Optional[str] = Query(None, description="Filter by incident type"),
     needs_follow_up: bool = Query(False, description="Only incidents with follow-ups due"),
     include_hidden: bool = Query(False, description="Include hidden incidents (moderators only)"),
+    before_id: Optional[int] = Query(None, description="Return incidents older than this incident (last id of the previous page)"),
     current_user: Optional[models.User] = Depends(optional_current_user),
 ):
     """Return recent incidents, including follow-up timeline and optional filters."""
+    cache_key = None
+    if current_user is None:
+        cache_key = (limit, status_filter, category_filter, incident_type, needs_follow_up, before_id)
+        cached = _anonymous_feed_cache.get(cache_key)
+        if cached is not MISSING:
+            return Response(content=cached, media_type="application/json")
 
-    q = (
-        db.query(models.Incident)
-        .options(
-            selectinload(models.Incident.reporter),
-            selectinload(models.Incident.follow_ups),
-            selectinload(models.Incident.media),
-            selectinload(models.Incident.comments).options(
-                selectinload(models.IncidentComment.user),
-                selectinload(models.IncidentComment.attachments),
-                selectinload(models.IncidentComment.reactions),
-            ),
-            selectinload(models.Incident.reactions),
-        )
-        .order_by(models.Incident.created_at.desc())
-    )
+    q = _incident_detail_query(db, current_user).order_by(models.Incident.created_at.desc(), models.Incident.id.desc())
 
     can_view_hidden = _can_view_hidden(current_user)
     if not can_view_hidden or not include_hidden:
@@ -278,75 +408,123 @@ def list_incidents(
         q = q.filter(
             models.Incident.follow_up_due_at.isnot(None),
             models.Incident.follow_up_due_at <= _now_utc(),
-            ~models.Incident.status.in_(tuple(RESOLVED_STATUSES)),
+            models.Incident.status.notin_(RESOLVED_STATUSES),
+        )
+    if before_id is not None:
+        # Keyset on (created_at, id): the cursor's timestamp is read in SQL so it compares in
+        # the stored format, and the page seeks into the created_at index instead of skipping rows.
+        cursor_created_at = (
+            select(models.Incident.created_at)
+            .where(models.Incident.id == before_id)
+            .scalar_subquery()
+        )
+        q = q.filter(
+            tuple_(models.Incident.created_at, models.Incident.id) < tuple_(cursor_created_at, before_id)
         )
 
     incidents = q.limit(limit).all()
+    _populate_interaction_metadata(db, incidents, current_user)
     for incident in incidents:
-        _populate_interaction_metadata(incident, current_user)
         apply_known_location_coordinates(incident)
 
-    return incidents
+    if cache_key is None:
+        return incidents
+    body = _INCIDENT_FEED_ADAPTER.dump_json(
+        _INCIDENT_FEED_ADAPTER.validate_python(incidents, from_attributes=True)
+    )
+    _anonymous_feed_cache.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/stats", response_model=schemas.IncidentStats)
 def incident_stats(db: Session = Depends(get_db)):
-    visible_filter = models.Incident.is_hidden.is_(False)
-    total = db.query(func.count(models.Incident.id)).filter(visible_filter).scalar() or 0
-
-    status_rows = (
-        db.query(models.Incident.status, func.count(models.Incident.id))
-        .filter(visible_filter)
-        .group_by(models.Incident.status)
-        .all()
+    stats = _stats_snapshot.get("stats")
+    if stats is MISSING:
+        now = _now_utc()
+        stats, next_follow_up_due = _compute_incident_stats(db, now)
+        ttl = None
+        if next_follow_up_due is not None:
+            ttl = max((next_follow_up_due - now).total_seconds(), 0.0)
+        _stats_snapshot.set("stats", stats, ttl_seconds=ttl)
+    return stats
+
+
+def _compute_incident_stats(db: Session, now: datetime):
+    """Return the stats payload plus when the next unresolved follow-up falls due."""
+    # One scan: aggregate per (status, type, sentiment) group, then fold the groups in Python.
+    prompt_answered_filter = (
+        models.Incident.still_happening.isnot(None)
+        | models.Incident.police_seen.isnot(None)
+        | models.Incident.feel_safe_now.isnot(None)
     )
-    by_status = {status: count for status, count in status_rows}
-
-    type_rows = (
-        db.query(models.Incident.incident_type, func.count(models.Incident.id))
-        .filter(visible_filter)
-        .group_by(models.Incident.incident_type)
-        .all()
+    unresolved_filter = models.Incident.status.notin_(RESOLVED_STATUSES)
+    active_follow_up_filter = (
+        models.Incident.follow_up_due_at.isnot(None)
+        & (models.Incident.follow_up_due_at <= now)
+        & unresolved_filter
     )
-    by_type = {incident_type: count for incident_type, count in type_rows}
-
-    prompt_answered = (
-        db.query(func.count(models.Incident.id))
-        .filter(
-            (models.Incident.still_happening.isnot(None))
-            | (models.Incident.police_seen.isnot(None))
-            | (models.Incident.feel_safe_now.isnot(None))
+    upcoming_follow_up_filter = (models.Incident.follow_up_due_at > now) & unresolved_filter
+    group_rows = (
+        db.query(
+            models.Incident.status,
+            models.Incident.incident_type,
+            models.Incident.safety_sentiment,
+            func.count(),
+            func.count().filter(prompt_answered_filter),
+            func.count().filter(active_follow_up_filter),
+            func.sum(models.Incident.credibility_score),
+            func.count(models.Incident.credibility_score),
+            func.min(models.Incident.follow_up_due_at).filter(upcoming_follow_up_filter),
+        )
+        .filter(models.Incident.is_hidden.is_(False))
+        .group_by(
+            models.Incident.status,
+            models.Incident.incident_type,
+            models.Incident.safety_sentiment,
         )
-        .filter(visible_filter)
-        .scalar()
-        or 0
-    )
-    prompt_completion_rate = round(prompt_answered / total, 3) if total else 0.0
-
-    sentiment_rows = (
-        db.query(models.Incident.safety_sentiment, func.count(models.Incident.id))
-        .filter(models.Incident.safety_sentiment.isnot(None))
-        .filter(visible_filter)
-        .group_by(models.Incident.safety_sentiment)
         .all()
     )
-    sentiment_breakdown = {sentiment: count for sentiment, count in sentiment_rows}
-
-    active_follow_up = (
-        db.query(func.count(models.Incident.id))
-        .filter(models.Incident.follow_up_due_at.isnot(None))
-        .filter(models.Incident.follow_up_due_at <= _now_utc())
-        .filter(~models.Incident.status.in_(tuple(RESOLVED_STATUSES)))
-        .filter(visible_filter)
-        .scalar()
-        or 0
-    )
 
-    avg_credibility = (
-        db.query(func.avg(models.Incident.credibility_score)).filter(visible_filter).scalar() or 0.0
-    )
+    total = 0
+    prompt_answered = 0
+    active_follow_up = 0
+    credibility_sum = 0.0
+    credibility_count = 0
+    next_follow_up_due: Optional[datetime] = None
+    by_status: Dict[str, int] = {}
+    by_type: Dict[str, int] = {}
+    sentiment_breakdown: Dict[str, int] = {}
+    for (
+        status_value,
+        incident_type,
+        sentiment,
+        count,
+        answered,
+        follow_ups,
+        score_sum,
+        score_count,
+        upcoming_due,
+    ) in group_rows:
+        total += count
+        prompt_answered += answered
+        active_follow_up += follow_ups
+        credibility_sum += score_sum or 0.0
+        credibility_count += score_count
+        by_status[status_value] = by_status.get(status_value, 0) + count
+        by_type[incident_type] = by_type.get(incident_type, 0) + count
+        if sentiment is not None:
+            sentiment_breakdown[sentiment] = sentiment_breakdown.get(sentiment, 0) + count
+        if upcoming_due is not None:
+            # SQLite hands timestamps back naive; they are stored in UTC.
+            if upcoming_due.tzinfo is None:
+                upcoming_due = upcoming_due.replace(tzinfo=timezone.utc)
+            if next_follow_up_due is None or upcoming_due < next_follow_up_due:
+                next_follow_up_due = upcoming_due
+
+    prompt_completion_rate = round(prompt_answered / total, 3) if total else 0.0
+    avg_credibility = credibility_sum / credibility_count if credibility_count else 0.0
 
-    return schemas.IncidentStats(
+    stats = schemas.IncidentStats(
         total=total,
         by_status=by_status,
         by_type=by_type,
@@ -355,6 +533,7 @@ def incident_stats(db: Session = Depends(get_db)):
         sentiment_breakdown=sentiment_breakdown,
         avg_credibility=round(float(avg_credibility), 3) if avg_credibility else 0.0,
     )
+    return stats, next_follow_up_due
 
 
 @router.get("/{incident_id}", response_model=schemas.IncidentPublic)
@@ -363,30 +542,23 @@ def get_incident(
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(optional_current_user),
 ):
-    incident = (
-        db.query(models.Incident)
-        .options(
-            selectinload(models.Incident.reporter),
-            selectinload(models.Incident.follow_ups),
-            selectinload(models.Incident.media),
-            selectinload(models.Incident.comments).options(
-                selectinload(models.IncidentComment.user),
-                selectinload(models.IncidentComment.attachments),
-                selectinload(models.IncidentComment.reactions),
-            ),
-            selectinload(models.Incident.reactions),
-        )
-        .filter(models.Incident.id == incident_id)
-        .first()
-    )
+    cache_key = (incident_id, current_user.id if current_user else None)
+    cached = _incident_detail_cache.get(cache_key)
+    if cached is not MISSING:
+        return Response(content=cached, media_type="application/json")
+
+    incident = _incident_detail_query(db, current_user).filter(models.Incident.id == incident_id).first()
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
     can_view_hidden = _can_view_hidden(current_user)
     if incident.is_hidden and not can_view_hidden:
         raise HTTPException(status_code=404, detail="Incident not found")
-    _populate_interaction_metadata(incident, current_user)
+    _populate_interaction_metadata(db, [incident], current_user)
     apply_known_location_coordinates(incident)
-    return incident
+
+    body = schemas.IncidentPublic.model_validate(incident).model_dump_json()
+    _incident_detail_cache.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=schemas.IncidentPublic, status_code=status.HTTP_201_CREATED)
@@ -427,29 +599,32 @@ def create_incident(
         reporter_alias=alias or None,
         follow_up_due_at=follow_up_due_at,
         credibility_score=credibility_score,
-        reporter_user_id=current_user.id,
-    )
-    apply_known_location_coordinates(row)
-    db.add(row)
-    db.flush()
-    for media in payload.media:
-        data = (media.data_base64 or "").strip()
-        if not data:
-            continue
-        db.add(
+        reporter=current_user,
+        media=[
             models.IncidentMedia(
-                incident_id=row.id,
                 media_type=media.media_type,
                 content_type=media.content_type,
-                data_base64=data,
+                data_base64=(media.data_base64 or "").strip(),
                 filename=media.filename,
             )
-        )
-    row.reporter = current_user
+            for media in payload.media
+            if (media.data_base64 or "").strip()
+        ],
+        # A new incident has none of these yet; seeding them keeps serialization from lazy-loading.
+        follow_ups=[],
+        comments=[],
+    )
+    apply_known_location_coordinates(row)
+    db.add(row)
+    db.flush()
     _notify_verifiers(db, row, current_user)
+    # No reactions yet, so the schema's zero counts apply without a query.
+    # Serialize before commit expires the row: the INSERTs already RETURNed the server
+    # defaults. Only follow_up_due_at is re-read so it matches the stored form other reads return.
+    db.expire(row, ["follow_up_due_at"])
+    response = schemas.IncidentPublic.model_validate(row)
     db.commit()
-    db.refresh(row)
-    return row
+    return response
 
 
 @router.patch("/{incident_id}", response_model=schemas.IncidentPublic)
@@ -458,18 +633,6 @@ def update_incident(
     payload: schemas.IncidentUpdate,
     db: Session = Depends(get_db),
 ):
-    incident = (
-        db.query(models.Incident)
-        .options(
-            selectinload(models.Incident.follow_ups),
-            selectinload(models.Incident.media),
-        )
-        .filter(models.Incident.id == incident_id)
-        .first()
-    )
-    if not incident:
-        raise HTTPException(status_code=404, detail="Incident not found")
-
     update_data = _model_dump(payload)
     if "location_text" in update_data:
         if update_data["location_text"]:
@@ -481,17 +644,22 @@ def update_incident(
             update_data["location_text"] = None
     if "credibility_score" in update_data and update_data["credibility_score"] is not None:
         update_data["credibility_score"] = max(0.0, min(1.0, update_data["credibility_score"]))
-
-    for field, value in update_data.items():
-        setattr(incident, field, value)
+    update_data["updated_at"] = _now_utc()
+
+    # Write only the patched columns and get the row back in the same statement.
+    incident = db.execute(
+        update(models.Incident)
+        .where(models.Incident.id == incident_id)
+        .values(**update_data)
+        .returning(models.Incident)
+    ).scalar_one_or_none()
+    if not incident:
+        raise HTTPException(status_code=404, detail="Incident not found")
 
     apply_known_location_coordinates(incident)
-    incident.updated_at = _now_utc()
     _apply_reward_progress(db, incident)
-    db.add(incident)
     db.commit()
-    db.refresh(incident)
-    return incident
+    return _reload_incident(db, incident.id, None)
 
 
 @router.post(
@@ -505,7 +673,13 @@ def create_follow_up(
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(optional_current_user),
 ):
-    incident = db.query(models.Incident).filter(models.Incident.id == incident_id).first()
+    # Lock the parent row: concurrent follow-ups read-modify-write its status and due time.
+    incident = (
+        db.query(models.Incident)
+        .filter(models.Incident.id == incident_id)
+        .with_for_update()
+        .first()
+    )
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
 
@@ -538,17 +712,18 @@ def create_follow_up(
     if payload.safety_sentiment:
         incident.safety_sentiment = payload.safety_sentiment
 
+    now = _now_utc()
     if payload.still_happening:
-        incident.follow_up_due_at = _now_utc() + timedelta(minutes=FOLLOW_UP_EXTENDED_MINUTES)
+        incident.follow_up_due_at = now + timedelta(minutes=FOLLOW_UP_EXTENDED_MINUTES)
     elif payload.still_happening is False:
         incident.follow_up_due_at = None
 
-    incident.updated_at = _now_utc()
+    incident.updated_at = now
     _apply_reward_progress(db, incident)
-    db.add(incident)
+    db.flush()
+    response = schemas.IncidentFollowUpPublic.model_validate(follow_up)
     db.commit()
-    db.refresh(follow_up)
-    return follow_up
+    return response
 
 
 @router.post(
@@ -562,43 +737,169 @@ def create_comment(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    incident = db.query(models.Incident).filter(models.Incident.id == incident_id).first()
-    if not incident:
+    _check_attachment_count(len(payload.media))
+    attachments = []
+    for media in payload.media:
+        data = (media.data_base64 or "").strip()
+        if not data:
+            continue
+        media_type = media.media_type
+        if media_type not in {"image", "video"}:
+            continue
+        content = decode_base64_payload(data)
+        if content is None:
+            raise HTTPException(status_code=422, detail="Attachment payload is not valid base64")
+        _check_attachment_size(content)
+        attachments.append(
+            models.IncidentCommentAttachment(
+                media_type=media_type,
+                content_type=(media.content_type or "").strip() or None,
+                data=content,
+                filename=(media.filename or "").strip() or None,
+            )
+        )
+    return _create_comment(db, incident_id, current_user, payload.body, attachments)
+
+
+@router.post(
+    "/{incident_id}/comments/upload",
+    response_model=schemas.IncidentCommentPublic,
+    status_code=status.HTTP_201_CREATED,
+)
+def upload_comment(
+    incident_id: int,
+    body: str = Form(..., min_length=1, max_length=2000),
+    files: List[UploadFile] = File([]),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Multipart variant of create_comment: attachments arrive as raw file parts instead of base64 JSON."""
+    _check_attachment_count(len(files))
+    attachments = []
+    for upload in files:
+        content_type = (upload.content_type or "").strip()
+        media_type = content_type.split("/", 1)[0]
+        if media_type not in {"image", "video"}:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unsupported attachment type: {content_type or 'unknown'}",
+            )
+        # Bounded read: one byte past the limit is enough to reject an oversized part.
+        content = upload.file.read(MAX_COMMENT_ATTACHMENT_BYTES + 1)
+        _check_attachment_size(content)
+        attachments.append(
+            models.IncidentCommentAttachment(
+                media_type=media_type,
+                content_type=content_type,
+                data=content,
+                filename=(upload.filename or "").strip() or None,
+            )
+        )
+    return _create_comment(db, incident_id, current_user, body, attachments)
+
+
+def _check_attachment_count(count: int) -> None:
+    if count > MAX_COMMENT_ATTACHMENTS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"A comment can carry at most {MAX_COMMENT_ATTACHMENTS} attachments",
+        )
+
+
+def _check_attachment_size(content: bytes) -> None:
+    if not content:
+        raise HTTPException(status_code=422, detail="Attachment is empty")
+    if len(content) > MAX_COMMENT_ATTACHMENT_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Attachments are limited to {MAX_COMMENT_ATTACHMENT_BYTES // (1024 * 1024)} MB",
+        )
+
+
+def _create_comment(
+    db: Session,
+    incident_id: int,
+    current_user: models.User,
+    body: str,
+    attachments: List[models.IncidentCommentAttachment],
+) -> models.IncidentComment:
+    incident_exists = db.query(models.Incident.id).filter(models.Incident.id == incident_id).first()
+    if not incident_exists:
         raise HTTPException(status_code=404, detail="Incident not found")
 
-    body = payload.body.strip()
+    body = body.strip()
     if not body:
         raise HTTPException(status_code=400, detail="Comment cannot be empty")
 
     comment = models.IncidentComment(
-        incident=incident,
+        incident_id=incident_id,
         user=current_user,
         body=body,
+        attachments=attachments,
     )
     db.add(comment)
-    db.flush()
-
-    for media in payload.media:
-        data = (media.data_base64 or "").strip()
-        if not data:
-            continue
-        media_type = media.media_type
-        if media_type not in {"image", "video"}:
-            continue
-        attachment = models.IncidentCommentAttachment(
-            comment_id=comment.id,
-            media_type=media_type,
-            content_type=(media.content_type or "").strip() or None,
-            data_base64=data,
-            filename=(media.filename or "").strip() or None,
-        )
-        db.add(attachment)
-
     db.commit()
 
     return _reload_comment(db, comment.id, current_user)
 
 
+@router.get("/{incident_id}/comments/{comment_id}/attachments/{attachment_id}")
+def get_comment_attachment(
+    incident_id: int,
+    comment_id: int,
+    attachment_id: int,
+    expires: Optional[int] = Query(None),
+    signature: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(optional_current_user),
+):
+    """Serve a comment attachment's stored bytes instead of an inline base64 string."""
+    # The bytes are loaded only after the visibility check, and not at all for a 304.
+    row = (
+        db.query(
+            models.IncidentCommentAttachment.content_type,
+            models.IncidentComment.is_hidden,
+            models.Incident.is_hidden,
+        )
+        .join(models.IncidentComment, models.IncidentCommentAttachment.comment_id == models.IncidentComment.id)
+        .join(models.Incident, models.IncidentComment.incident_id == models.Incident.id)
+        .filter(
+            models.IncidentCommentAttachment.id == attachment_id,
+            models.IncidentCommentAttachment.comment_id == comment_id,
+            models.IncidentComment.incident_id == incident_id,
+        )
+        .first()
+    )
+    if not row:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+    content_type, comment_hidden, incident_hidden = row
+    signed = verify_resource_signature(
+        _attachment_path(incident_id, comment_id, attachment_id), expires, signature
+    )
+    if (comment_hidden or incident_hidden) and not _can_view_hidden(current_user) and not signed:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+
+    # Attachment bytes never change after upload, so the id alone identifies the representation.
+    headers = {
+        "Cache-Control": SIGNED_ATTACHMENT_CACHE_CONTROL if signed else ATTACHMENT_CACHE_CONTROL,
+        "ETag": f'"attachment-{attachment_id}"',
+    }
+    if if_none_match == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    content = (
+        db.query(models.IncidentCommentAttachment.data)
+        .filter(models.IncidentCommentAttachment.id == attachment_id)
+        .scalar()
+    )
+    return Response(
+        content=content,
+        media_type=content_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
 @router.post(
     "/{incident_id}/reactions",
     response_model=schemas.IncidentReactionStatus,
@@ -613,33 +914,10 @@ def set_incident_reaction(
     if not incident_exists:
         raise HTTPException(status_code=404, detail="Incident not found")
 
-    reaction = (
-        db.query(models.IncidentReaction)
-        .filter(
-            models.IncidentReaction.incident_id == incident_id,
-            models.IncidentReaction.user_id == current_user.id,
-        )
-        .first()
-    )
-
-    if payload.action == "clear":
-        if reaction:
-            db.delete(reaction)
-            db.commit()
-        return _reaction_status(db, incident_id, current_user)
-
-    if reaction:
-        reaction.value = payload.action
-    else:
-        reaction = models.IncidentReaction(
-            incident_id=incident_id,
-            user_id=current_user.id,
-            value=payload.action,
-        )
-        db.add(reaction)
-
+    _write_reaction(db, models.IncidentReaction, "incident_id", incident_id, current_user.id, payload.action)
+    reaction_status = _reaction_status(db, incident_id, current_user)
     db.commit()
-    return _reaction_status(db, incident_id, current_user)
+    return reaction_status
 
 
 @router.post(
@@ -653,42 +931,18 @@ def set_comment_reaction(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    comment = (
-        db.query(models.IncidentComment)
+    comment_exists = (
+        db.query(models.IncidentComment.id)
         .filter(
             models.IncidentComment.id == comment_id,
             models.IncidentComment.incident_id == incident_id,
         )
         .first()
     )
-    if not comment:
+    if not comment_exists:
         raise HTTPException(status_code=404, detail="Comment not found")
 
-    reaction = (
-        db.query(models.IncidentCommentReaction)
-        .filter(
-            models.IncidentCommentReaction.comment_id == comment_id,
-            models.IncidentCommentReaction.user_id == current_user.id,
-        )
-        .first()
-    )
-
-    if payload.action == "clear":
-        if reaction:
-            db.delete(reaction)
-            db.commit()
-        return _reload_comment(db, comment_id, current_user)
-
-    if reaction:
-        reaction.value = payload.action
-    else:
-        reaction = models.IncidentCommentReaction(
-            comment_id=comment_id,
-            user_id=current_user.id,
-            value=payload.action,
-        )
-        db.add(reaction)
-
+    _write_reaction(db, models.IncidentCommentReaction, "comment_id", comment_id, current_user.id, payload.action)
     db.commit()
     return _reload_comment(db, comment_id, current_user)
 
@@ -704,30 +958,13 @@ def update_incident_visibility(
     current_user: models.User = Depends(get_current_user),
 ):
     moderator = _assert_moderator(current_user)
-    incident = (
-        db.query(models.Incident)
-        .options(
-            selectinload(models.Incident.reporter),
-            selectinload(models.Incident.follow_ups),
-            selectinload(models.Incident.media),
-            selectinload(models.Incident.comments).options(
-                selectinload(models.IncidentComment.user),
-                selectinload(models.IncidentComment.attachments),
-                selectinload(models.IncidentComment.reactions),
-            ),
-            selectinload(models.Incident.reactions),
-        )
-        .filter(models.Incident.id == incident_id)
-        .first()
-    )
+    incident = db.query(models.Incident).filter(models.Incident.id == incident_id).first()
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
     incident.is_hidden = payload.hidden
     db.add(incident)
     db.commit()
-    db.refresh(incident)
-    _populate_interaction_metadata(incident, moderator)
-    return incident
+    return _reload_incident(db, incident.id, moderator)
 
 
 @router.patch(
@@ -744,11 +981,6 @@ def update_comment_visibility(
     moderator = _assert_moderator(current_user)
     comment = (
         db.query(models.IncidentComment)
-        .options(
-            selectinload(models.IncidentComment.user),
-            selectinload(models.IncidentComment.attachments),
-            selectinload(models.IncidentComment.reactions),
-        )
         .filter(
             models.IncidentComment.id == comment_id,
             models.IncidentComment.incident_id == incident_id,
@@ -760,9 +992,7 @@ def update_comment_visibility(
     comment.is_hidden = payload.hidden
     db.add(comment)
     db.commit()
-    db.refresh(comment)
-    _populate_comment_metadata(comment, moderator)
-    return comment
+    return _reload_comment(db, comment.id, moderator)
 
 
 @router.patch(
@@ -779,22 +1009,7 @@ def update_incident_status(
     desired = payload.status.strip()
     if desired not in ALLOWED_STATUS_UPDATES:
         raise HTTPException(status_code=400, detail="Unsupported status selection")
-    incident = (
-        db.query(models.Incident)
-        .options(
-            selectinload(models.Incident.reporter),
-            selectinload(models.Incident.follow_ups),
-            selectinload(models.Incident.media),
-            selectinload(models.Incident.comments).options(
-                selectinload(models.IncidentComment.user),
-                selectinload(models.IncidentComment.attachments),
-                selectinload(models.IncidentComment.reactions),
-            ),
-            selectinload(models.Incident.reactions),
-        )
-        .filter(models.Incident.id == incident_id)
-        .first()
-    )
+    incident = db.query(models.Incident).filter(models.Incident.id == incident_id).first()
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
     incident.status = desired
@@ -802,6 +1017,4 @@ def update_incident_status(
     _apply_reward_progress(db, incident)
     db.add(incident)
     db.commit()
-    db.refresh(incident)
-    _populate_interaction_metadata(incident, reviewer)
-    return incident
+    return _reload_incident(db, incident.id, reviewer)
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, tuple_, update
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
@@ -21,17 +22,48 @@ def list_notifications(
     current_user: models.User = Depends(get_current_user),
     status_filter: Optional[str] = Query(None, regex="^(read|unread)$"),
     limit: int = Query(20, ge=1, le=100),
+    before_id: Optional[int] = Query(None, description="Return notifications older than this one (last id of the previous page)"),
 ):
     query = (
         db.query(models.Notification)
         .filter(models.Notification.recipient_id == current_user.id)
-        .order_by(models.Notification.created_at.desc())
+        .order_by(models.Notification.created_at.desc(), models.Notification.id.desc())
     )
     if status_filter:
         query = query.filter(models.Notification.status == status_filter)
+    if before_id is not None:
+        # Same keyset as the incident feed: compare (created_at, id) against the cursor row in SQL.
+        cursor_created_at = (
+            select(models.Notification.created_at)
+            .where(models.Notification.id == before_id)
+            .scalar_subquery()
+        )
+        query = query.filter(
+            tuple_(models.Notification.created_at, models.Notification.id) < tuple_(cursor_created_at, before_id)
+        )
     return query.limit(limit).all()
 
 
+@router.post("/read", response_model=schemas.NotificationReadResult)
+def mark_notifications_read(
+    payload: schemas.NotificationReadBatch,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Mark the given notifications (or all of them) as read with one UPDATE."""
+    if not payload.all and not payload.ids:
+        return schemas.NotificationReadResult(updated=0)
+    stmt = update(models.Notification).where(
+        models.Notification.recipient_id == current_user.id,
+        models.Notification.status != "read",
+    )
+    if not payload.all:
+        stmt = stmt.where(models.Notification.id.in_(payload.ids))
+    result = db.execute(stmt.values(status="read", read_at=_now_utc()))
+    db.commit()
+    return schemas.NotificationReadResult(updated=result.rowcount)
+
+
 @router.post(
     "/{notification_id}/read",
     response_model=schemas.NotificationPublic,
@@ -57,6 +89,7 @@ def mark_notification_read(
         notification.status = "read"
         notification.read_at = _now_utc()
         db.add(notification)
+        response = schemas.NotificationPublic.model_validate(notification)
         db.commit()
-        db.refresh(notification)
+        return response
     return notification
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, joinedload
 
 from .. import models, schemas
 from ..db import get_db
@@ -14,6 +16,10 @@ from ..services.rewards import get_reward_partner, list_reward_partners
 router = APIRouter(prefix="/rewards", tags=["rewards"])
 
 REVIEWER_ROLES = {"admin", "staff"}
+# Partners are static configuration, so the listing is validated and encoded once at import.
+_PARTNERS_BODY = TypeAdapter(List[schemas.RewardPartner]).dump_json(
+    [schemas.RewardPartner(**partner) for partner in list_reward_partners()]
+)
 
 
 def _assert_reviewer(user: models.User) -> models.User:
@@ -22,27 +28,40 @@ def _assert_reviewer(user: models.User) -> models.User:
     return user
 
 
+def _ledger_cursor_created_at(entry_id: int):
+    """Keyset cursor timestamp, read in SQL so it compares in the stored format."""
+    return (
+        select(models.RewardLedgerEntry.created_at)
+        .where(models.RewardLedgerEntry.id == entry_id)
+        .scalar_subquery()
+    )
+
+
 @router.get("/partners", response_model=List[schemas.RewardPartner])
 def reward_partners():
     """List merchant partners that currently accept manual redemptions."""
-    return [schemas.RewardPartner(**partner) for partner in list_reward_partners()]
+    return Response(content=_PARTNERS_BODY, media_type="application/json")
 
 
 @router.get("/ledger", response_model=List[schemas.RewardLedgerEntryPublic])
 def my_reward_ledger(
     limit: int = Query(25, ge=1, le=100),
+    before_id: Optional[int] = Query(None, description="Return entries older than this one (last id of the previous page)"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """Return the latest ledger entries for the authenticated user."""
-    entries = (
+    query = (
         db.query(models.RewardLedgerEntry)
         .filter(models.RewardLedgerEntry.user_id == current_user.id)
-        .order_by(models.RewardLedgerEntry.created_at.desc())
-        .limit(limit)
-        .all()
+        .order_by(models.RewardLedgerEntry.created_at.desc(), models.RewardLedgerEntry.id.desc())
     )
-    return entries
+    if before_id is not None:
+        query = query.filter(
+            tuple_(models.RewardLedgerEntry.created_at, models.RewardLedgerEntry.id)
+            < tuple_(_ledger_cursor_created_at(before_id), before_id)
+        )
+    return query.limit(limit).all()
 
 
 @router.post(
@@ -84,31 +103,37 @@ def request_redemption(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
+    db.flush()
+    response = schemas.RewardLedgerEntryPublic.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    return response
 
 
 @router.get("/requests", response_model=List[schemas.RewardLedgerEntryPublic])
 def pending_redemption_requests(
     limit: int = Query(50, ge=1, le=200),
+    after_id: Optional[int] = Query(None, description="Return requests queued after this one (last id of the previous page)"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """Allow staff/admin users to review pending manual redemptions."""
     _assert_reviewer(current_user)
-    entries = (
+    # Many-to-one owner: join it into the page query rather than a second IN query.
+    query = (
         db.query(models.RewardLedgerEntry)
-        .options(selectinload(models.RewardLedgerEntry.user))
+        .options(joinedload(models.RewardLedgerEntry.user))
         .filter(
             models.RewardLedgerEntry.source == "redemption",
             models.RewardLedgerEntry.status == "pending",
         )
-        .order_by(models.RewardLedgerEntry.created_at.asc())
-        .limit(limit)
-        .all()
+        .order_by(models.RewardLedgerEntry.created_at.asc(), models.RewardLedgerEntry.id.asc())
     )
-    return entries
+    if after_id is not None:
+        query = query.filter(
+            tuple_(models.RewardLedgerEntry.created_at, models.RewardLedgerEntry.id)
+            > tuple_(_ledger_cursor_created_at(after_id), after_id)
+        )
+    return query.limit(limit).all()
 
 
 @router.post(
@@ -122,9 +147,10 @@ def decide_redemption_request(
     current_user: models.User = Depends(get_current_user),
 ):
     reviewer = _assert_reviewer(current_user)
+    # Single row: join the owner into the same SELECT rather than a follow-up IN query.
     entry = (
         db.query(models.RewardLedgerEntry)
-        .options(selectinload(models.RewardLedgerEntry.user))
+        .options(joinedload(models.RewardLedgerEntry.user))
         .filter(
             models.RewardLedgerEntry.id == entry_id,
             models.RewardLedgerEntry.source == "redemption",
@@ -137,12 +163,7 @@ def decide_redemption_request(
         raise HTTPException(status_code=400, detail="Request already processed")
     reward_owner = entry.user
     if not reward_owner:
-        reward_owner = (
-            db.query(models.User).filter(models.User.id == entry.user_id).first()
-        )
-        if not reward_owner:
-            raise HTTPException(status_code=404, detail="User not found for this request")
-        entry.user = reward_owner
+        raise HTTPException(status_code=404, detail="User not found for this request")
 
     note_suffix = f" · {payload.note.strip()}" if payload.note else ""
 
@@ -172,6 +193,7 @@ def decide_redemption_request(
     else:
         raise HTTPException(status_code=400, detail="Unsupported action")
 
+    db.flush()
+    response = schemas.RewardLedgerEntryPublic.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    return response
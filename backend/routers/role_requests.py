@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from .. import models, schemas
 from ..db import get_db
@@ -28,12 +28,25 @@ def list_role_requests(
     current_user: models.User = Depends(get_current_user),
 ):
     _assert_reviewer(current_user)
+    # Project just the serialized columns with both users joined in, instead of hydrating
+    # RoleRequest and User entities over three queries.
+    reviewer = aliased(models.User)
     q = (
-        db.query(models.RoleRequest)
-        .options(
-            selectinload(models.RoleRequest.user),
-            selectinload(models.RoleRequest.reviewer),
+        db.query(
+            models.RoleRequest.id,
+            models.RoleRequest.requested_role,
+            models.RoleRequest.status,
+            models.RoleRequest.justification,
+            models.RoleRequest.reviewer_notes,
+            models.RoleRequest.created_at,
+            models.RoleRequest.decided_at,
+            models.User.id.label("user_id"),
+            models.User.display_name.label("user_display_name"),
+            reviewer.id.label("reviewer_id"),
+            reviewer.display_name.label("reviewer_display_name"),
         )
+        .join(models.RoleRequest.user)
+        .outerjoin(models.RoleRequest.reviewer.of_type(reviewer))
         .order_by(models.RoleRequest.created_at.desc())
     )
 
@@ -42,7 +55,25 @@ def list_role_requests(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status filter")
         q = q.filter(models.RoleRequest.status == status_filter)
 
-    return q.limit(limit).all()
+    return [_role_request_from_row(row) for row in q.limit(limit)]
+
+
+def _role_request_from_row(row) -> schemas.RoleRequestPublic:
+    # Column values come straight from the database, so validation is skipped.
+    reviewer = None
+    if row.reviewer_id is not None:
+        reviewer = schemas.UserSummary.model_construct(id=row.reviewer_id, display_name=row.reviewer_display_name)
+    return schemas.RoleRequestPublic.model_construct(
+        id=row.id,
+        requested_role=row.requested_role,
+        status=row.status,
+        justification=row.justification,
+        reviewer_notes=row.reviewer_notes,
+        created_at=row.created_at,
+        decided_at=row.decided_at,
+        user=schemas.UserSummary.model_construct(id=row.user_id, display_name=row.user_display_name),
+        reviewer=reviewer,
+    )
 
 
 @router.post("/{request_id}/decision", response_model=schemas.RoleRequestPublic)
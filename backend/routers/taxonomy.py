@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import hashlib
+
+from fastapi import APIRouter, Request, Response
 
 from .. import schemas
 
@@ -29,6 +31,16 @@ TAXONOMY = schemas.TaxonomyResponse(
 )
 
 
+# The taxonomy only changes with a deploy, so its body and validator are computed once.
+TAXONOMY_BODY = TAXONOMY.model_dump_json().encode("utf-8")
+TAXONOMY_HEADERS = {
+    "ETag": f'"{hashlib.sha256(TAXONOMY_BODY).hexdigest()[:32]}"',
+    "Cache-Control": "public, max-age=3600",
+}
+
+
 @router.get("/", response_model=schemas.TaxonomyResponse)
-def fetch_taxonomy():
-    return TAXONOMY
+def fetch_taxonomy(request: Request):
+    if request.headers.get("if-none-match") == TAXONOMY_HEADERS["ETag"]:
+        return Response(status_code=304, headers=TAXONOMY_HEADERS)
+    return Response(content=TAXONOMY_BODY, media_type="application/json", headers=TAXONOMY_HEADERS)
@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, raiseload
 
 from .. import models, schemas
 from ..db import get_db
@@ -12,7 +12,7 @@ from ..services.ledger import record_reward_entry
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-VERIFIED_STATUSES = {"community-confirmed", "official-confirmed", "resolved"}
+VERIFIED_STATUSES = ("community-confirmed", "official-confirmed", "resolved")
 ADMIN_ROLE = "admin"
 
 
@@ -22,14 +22,9 @@ def _assert_admin(user: models.User) -> models.User:
     return user
 
 
-def _serialize_posts(incidents: List[models.Incident]) -> List[schemas.UserPostBrief]:
+def _serialize_posts(posts: List[Tuple[models.Incident, int]]) -> List[schemas.UserPostBrief]:
     serialized = []
-    for incident in incidents:
-        likes = 0
-        if hasattr(incident, "reactions"):
-            for reaction in incident.reactions:
-                if reaction.value == "like":
-                    likes += 1
+    for incident, likes in posts:
         serialized.append(
             schemas.UserPostBrief(
                 id=incident.id,
@@ -49,60 +44,63 @@ def get_my_overview(
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    incidents = (
-        db.query(models.Incident)
-        .options(selectinload(models.Incident.reactions))
+    # Likes are counted per post from the reaction covering index instead of loading every reaction.
+    likes = (
+        select(func.count())
+        .select_from(models.IncidentReaction)
+        .where(
+            models.IncidentReaction.incident_id == models.Incident.id,
+            models.IncidentReaction.value == "like",
+        )
+        .correlate(models.Incident)
+        .scalar_subquery()
+    )
+    posts = (
+        db.query(models.Incident, likes)
+        .options(raiseload("*"))
         .filter(models.Incident.reporter_user_id == current_user.id)
         .order_by(models.Incident.created_at.desc())
         .limit(25)
         .all()
     )
 
-    total_posts = (
-        db.query(func.count(models.Incident.id))
-        .filter(models.Incident.reporter_user_id == current_user.id)
-        .scalar()
-        or 0
-    )
-
-    confirmed_posts = (
-        db.query(func.count(models.Incident.id))
-        .filter(
+    # Every counter is a scalar subquery of one SELECT, so the overview costs a single round trip.
+    total_posts, confirmed_posts, total_likes, unread_notifications = db.query(
+        select(func.count())
+        .select_from(models.Incident)
+        .where(models.Incident.reporter_user_id == current_user.id)
+        .scalar_subquery(),
+        select(func.count())
+        .select_from(models.Incident)
+        .where(
             models.Incident.reporter_user_id == current_user.id,
-            models.Incident.status.in_(tuple(VERIFIED_STATUSES)),
+            models.Incident.status.in_(VERIFIED_STATUSES),
         )
-        .scalar()
-        or 0
-    )
-
-    total_likes = (
-        db.query(func.count(models.IncidentReaction.id))
+        .scalar_subquery(),
+        select(func.count())
+        .select_from(models.IncidentReaction)
         .join(
             models.Incident,
             models.IncidentReaction.incident_id == models.Incident.id,
         )
-        .filter(
+        .where(
             models.Incident.reporter_user_id == current_user.id,
             models.IncidentReaction.value == "like",
         )
-        .scalar()
-        or 0
-    )
-
-    unread_notifications = (
-        db.query(func.count(models.Notification.id))
-        .filter(
+        .scalar_subquery(),
+        select(func.count())
+        .select_from(models.Notification)
+        .where(
             models.Notification.recipient_id == current_user.id,
             models.Notification.status == "unread",
         )
-        .scalar()
-        or 0
-    )
+        .scalar_subquery(),
+    ).one()
 
     ledger_entries = (
         db.query(models.RewardLedgerEntry)
         .filter(models.RewardLedgerEntry.user_id == current_user.id)
-        .order_by(models.RewardLedgerEntry.created_at.desc())
+        .order_by(models.RewardLedgerEntry.created_at.desc(), models.RewardLedgerEntry.id.desc())
         .limit(15)
         .all()
     )
@@ -110,9 +108,9 @@ def get_my_overview(
     progress = tier_progress(current_user.reward_points)
 
     rewards = schemas.UserRewardSummary(
-        total_posts=total_posts,
-        confirmed_posts=confirmed_posts,
-        total_likes=total_likes,
+        total_posts=total_posts or 0,
+        confirmed_posts=confirmed_posts or 0,
+        total_likes=total_likes or 0,
         points=current_user.reward_points,
         membership_tier=current_user.membership_tier,
         next_tier=progress.get("next"),
@@ -122,8 +120,8 @@ def get_my_overview(
     return schemas.UserOverview(
         profile=current_user,
         rewards=rewards,
-        recent_posts=_serialize_posts(incidents),
-        unread_notifications=unread_notifications,
+        recent_posts=_serialize_posts(posts),
+        unread_notifications=unread_notifications or 0,
         ledger=ledger_entries,
     )
 
@@ -138,11 +136,10 @@ def search_users(
     _assert_admin(current_user)
     qset = db.query(models.User)
     if query:
-        like = f"%{query.strip().lower()}%"
-        qset = qset.filter(
-            func.lower(models.User.email).like(like)
-            | func.lower(models.User.display_name).like(like)
-        )
+        like = f"%{query.strip()}%"
+        # ilike keeps the columns bare, so a trigram index can serve it on PostgreSQL; SQLite
+        # walks ix_users_created_at newest-first and stops once `limit` users match.
+        qset = qset.filter(models.User.email.ilike(like) | models.User.display_name.ilike(like))
     return qset.order_by(models.User.created_at.desc()).limit(limit).all()
 
 
@@ -171,6 +168,7 @@ def update_user_rewards(
         )
     else:
         db.add(user)
+    db.flush()
+    response = schemas.UserProfile.model_validate(user)
     db.commit()
-    db.refresh(user)
-    return user
+    return response
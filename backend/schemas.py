@@ -3,11 +3,12 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, List, Optional, Literal
 
-from pydantic import BaseModel, EmailStr, Field, constr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, constr
 
 IncidentType = Literal["police", "community", "public-order"]
 ContactedAuthorities = Literal["unknown", "none", "service-request", "911", "not-needed"]
 SafetySentiment = Literal["safe", "uneasy", "unsafe", "unsure"]
+IncidentStatus = Literal["unverified", "community-confirmed", "official-confirmed", "resolved"]
 UserRole = Literal["resident", "staff", "reporter", "officer"]
 
 
@@ -57,6 +58,12 @@ class IncidentBase(BaseModel):
 
 
 class IncidentCreate(IncidentBase):
+    # Inputs are checked against the workflow values; responses keep plain str so rows written
+    # before the literal existed still serialize.
+    status: Optional[IncidentStatus] = Field(
+        default="unverified",
+        description="Verification / resolution status",
+    )
     media: List["IncidentMediaPayload"] = Field(
         default_factory=list,
         description="Optional media attachments to seed the thread",
@@ -75,7 +82,7 @@ class IncidentUpdate(BaseModel):
     police_seen: Optional[bool] = None
     contacted_authorities: Optional[ContactedAuthorities] = None
     safety_sentiment: Optional[SafetySentiment] = None
-    status: Optional[str] = None
+    status: Optional[IncidentStatus] = None
     reporter_alias: Optional[str] = Field(None, max_length=50)
     credibility_score: Optional[float] = Field(
         None,
@@ -97,23 +104,21 @@ class IncidentFollowUpBase(BaseModel):
 
 
 class IncidentFollowUpCreate(IncidentFollowUpBase):
-    pass
+    status: Optional[IncidentStatus] = None
 
 
 class IncidentFollowUpPublic(IncidentFollowUpBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserSummary(BaseModel):
     id: int
     display_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserProfile(UserSummary):
@@ -123,8 +128,7 @@ class UserProfile(UserSummary):
     reward_points: int
     membership_tier: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
@@ -141,8 +145,16 @@ class NotificationPublic(BaseModel):
     incident_id: Optional[int] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationReadBatch(BaseModel):
+    ids: List[int] = Field(default_factory=list, max_length=500)
+    all: bool = Field(False, description="Mark every unread notification as read")
+
+
+class NotificationReadResult(BaseModel):
+    updated: int
 
 
 class AuthEmailRegister(BaseModel):
@@ -198,8 +210,7 @@ class RoleRequestPublic(BaseModel):
     user: UserSummary
     reviewer: Optional[UserSummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleRequestDecision(BaseModel):
@@ -231,8 +242,7 @@ class IncidentCommentPublic(BaseModel):
     viewer_reaction: Optional[Literal["like", "unlike"]] = None
     is_hidden: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IncidentReactionUpdate(BaseModel):
@@ -263,8 +273,7 @@ class IncidentMediaPublic(MediaPayloadBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IncidentCommentMediaBase(MediaPayloadBase):
@@ -275,12 +284,17 @@ class IncidentCommentMediaCreate(IncidentCommentMediaBase):
     pass
 
 
-class IncidentCommentAttachmentPublic(IncidentCommentMediaBase):
+class IncidentCommentAttachmentPublic(BaseModel):
+    """Attachment metadata; the bytes are served separately from ``url``."""
+
     id: int
+    media_type: Literal["image", "video"]
+    content_type: Optional[str] = None
+    filename: Optional[str] = None
+    url: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IncidentCommentReactionUpdate(BaseModel):
@@ -303,8 +317,7 @@ class IncidentPublic(IncidentBase):
     reward_points_awarded: int = 0
     is_hidden: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IncidentStats(BaseModel):
@@ -353,8 +366,7 @@ class UserPostBrief(BaseModel):
     likes_count: int
     reward_points_awarded: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserRewardSummary(BaseModel):
@@ -386,8 +398,7 @@ class RewardLedgerEntryPublic(BaseModel):
     created_at: datetime
     user: Optional[UserSummary] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RewardPartner(BaseModel):
@@ -4,7 +4,7 @@ import argparse
 
 from backend.db import SessionLocal
 from backend.models import User
-from backend.security import get_password_hash
+from backend.services.passwords import get_password_hash
 
 
 def bootstrap_admin(email: str, password: str, display_name: str | None = None) -> User:
@@ -0,0 +1,10 @@
+from backend.db import run_migrations
+
+
+def main() -> None:
+    run_migrations()
+    print("Database migrated (tables created, SQLite patches applied).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+from sqlalchemy import insert
 
 from backend import models
 from backend.db import SessionLocal
-from backend.services.locations import apply_known_location_coordinates
-try:
-    from backend.security import get_password_hash as _get_password_hash
-except ModuleNotFoundError:  # pragma: no cover - fallback for minimal environments
-    import hashlib
-
-    def _get_password_hash(password: str) -> str:
-        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        return f"sha256${digest}"
-else:
-    _get_password_hash = _get_password_hash
+from backend.services.locations import lookup_known_coordinates
 
 SEED_USER = {
   "email": "demo@civicsafety.local",
@@ -68,6 +61,19 @@ INCIDENTS = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _seed_password_hash() -> str:
+  # passlib is imported only when the demo user actually has to be created.
+  try:
+    from backend.services.passwords import get_password_hash
+  except ModuleNotFoundError:  # pragma: no cover - fallback for minimal environments
+    import hashlib
+
+    digest = hashlib.sha256(SEED_USER["password"].encode("utf-8")).hexdigest()
+    return f"sha256${digest}"
+  return get_password_hash(SEED_USER["password"])
+
+
 def main() -> None:
   db = SessionLocal()
   try:
@@ -75,7 +81,7 @@ def main() -> None:
     if not user:
       user = models.User(
         email=SEED_USER["email"],
-        hashed_password=_get_password_hash(SEED_USER["password"]),
+        hashed_password=_seed_password_hash(),
         display_name=SEED_USER["display_name"],
         auth_provider="password",
         role="resident",
@@ -84,37 +90,33 @@ def main() -> None:
       db.flush()
 
     existing_descriptions = {
-      row.description for row in db.query(models.Incident.description).all()
+      description
+      for (description,) in db.query(models.Incident.description).filter(
+        models.Incident.description.in_([payload["description"] for payload in INCIDENTS])
+      )
     }
 
     now = datetime.now(timezone.utc)
-    created = 0
+    rows = []
     for index, payload in enumerate(INCIDENTS):
       if payload["description"] in existing_descriptions:
         continue
 
-      incident = models.Incident(
-        category=payload["category"],
-        description=payload["description"],
-        incident_type=payload["incident_type"],
-        location_text=payload["location_text"],
-        status=payload["status"],
-        reporter_alias=payload["reporter_alias"],
-        still_happening=payload["still_happening"],
-        feel_safe_now=payload["feel_safe_now"],
-        police_seen=payload["police_seen"],
-        contacted_authorities=payload["contacted_authorities"],
-        safety_sentiment=payload["safety_sentiment"],
-        credibility_score=payload["credibility_score"],
+      row = dict(
+        payload,
         follow_up_due_at=(
           now + timedelta(minutes=90 + (index * 15)) if payload["still_happening"] else None
         ),
         reporter_user_id=user.id,
       )
-      apply_known_location_coordinates(incident)
-      db.add(incident)
-      created += 1
+      coords = lookup_known_coordinates(payload["location_text"])
+      if coords:
+        row["lat"], row["lng"] = coords
+      rows.append(row)
 
+    if rows:
+      db.execute(insert(models.Incident), rows)
+    created = len(rows)
     db.commit()
     print(f"Seeded {created} incidents (user: {user.email}).")
   finally:
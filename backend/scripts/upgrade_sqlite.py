@@ -1,9 +1,10 @@
-from backend.db import ensure_sqlite_schema
+from backend.db import run_migrations
 
 
 def main() -> None:
-    ensure_sqlite_schema()
-    print("SQLite schema updated (users/incidents tables are synced).")
+    # The SQLite patches index tables that older files may lack, so create those first.
+    run_migrations()
+    print("SQLite schema updated (missing tables created, patches applied).")
 
 
 if __name__ == "__main__":
@@ -1,60 +1,62 @@
+import hmac
 import os
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import timedelta
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from passlib.exc import MissingBackendError
+from jose import JWTError, jwk, jwt
 import hashlib
 from sqlalchemy.orm import Session
 
 from . import models
 from .db import get_db
+from .services.cache import MISSING, TTLCache
 
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "super-secret-key-change-me")
 ALGORITHM = "HS256"
+# Built once: passing the raw secret makes python-jose construct a fresh key object on every encode/decode.
+SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
-# bcrypt 在某些 macOS / conda 环境下会加载到系统旧版扩展，触发 MissingBackendError。
-# 统一改用 pbkdf2_sha256，避免对底层 C 扩展的依赖。
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
-
-FALLBACK_PREFIX = "sha256$"
-
-
-def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
-    if not hashed_password:
-        return False
-    if hashed_password.startswith(FALLBACK_PREFIX):
-        expected = hashlib.sha256(plain_password.encode("utf-8")).hexdigest()
-        return hashed_password.split("$", 1)[1] == expected
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    try:
-        return pwd_context.hash(password)
-    except MissingBackendError:
-        # Dev fallback when bcrypt extras are unavailable.
-        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
-        return f"{FALLBACK_PREFIX}{digest}"
+DECODED_TOKEN_CACHE_SIZE = 4096
+DECODED_TOKEN_TTL_SECONDS = 300
 
 
 def create_access_token(user: models.User, expires_delta: Optional[timedelta] = None) -> str:
+    # iat/exp are NumericDate seconds; reading the clock once keeps them consistent.
+    issued_at = int(time.time())
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
     to_encode = {
         "sub": str(user.id),
         "email": user.email,
         "provider": user.auth_provider,
-        "iat": int(datetime.now(timezone.utc).timestamp()),
+        "iat": issued_at,
+        "exp": issued_at + lifetime,
     }
-    expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode["exp"] = expire
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
+
+
+def sign_resource_path(path: str, expires_at: int) -> str:
+    """HMAC that lets a plain GET (an <img> or <video> source) fetch ``path`` until ``expires_at``."""
+    message = f"{path}:{expires_at}".encode("utf-8")
+    return hmac.new(SECRET_KEY.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def verify_resource_signature(path: str, expires_at: Optional[int], signature: Optional[str]) -> bool:
+    if not expires_at or not signature or expires_at < time.time():
+        return False
+    return hmac.compare_digest(sign_resource_path(path, expires_at), signature)
+
+
+# sha256 of a verified token -> its user id. Entries never outlive the token's exp claim;
+# only the signature check is skipped, the user row is still loaded on every request.
+_decoded_tokens = TTLCache(ttl_seconds=DECODED_TOKEN_TTL_SECONDS, max_entries=DECODED_TOKEN_CACHE_SIZE)
 
 
 def get_user_from_token(token: str, db: Session) -> models.User:
@@ -63,15 +65,22 @@ def get_user_from_token(token: str, db: Session) -> models.User:
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError as exc:
-        raise credentials_exception from exc
-
-    user = db.query(models.User).filter(models.User.id == int(user_id)).first()
+    token_key = hashlib.sha256(token.encode("utf-8")).digest()
+    user_id = _decoded_tokens.get(token_key)
+    if user_id is MISSING:
+        try:
+            payload = jwt.decode(token, SIGNING_KEY, algorithms=[ALGORITHM])
+            user_id = payload.get("sub")
+            if user_id is None:
+                raise credentials_exception
+        except JWTError as exc:
+            raise credentials_exception from exc
+        expires_in = payload.get("exp", 0) - time.time()
+        if expires_in > 0:
+            _decoded_tokens.set(token_key, user_id, ttl_seconds=expires_in)
+
+    # Session.get checks the identity map first, so repeat lookups within one request skip the SELECT.
+    user = db.get(models.User, int(user_id))
     if user is None:
         raise credentials_exception
     return user
@@ -1,3 +1,3 @@
 """Shared service helpers for business logic layers."""
 
-__all__ = ["rewards", "role_requests"]
+__all__ = ["media", "rewards", "role_requests"]
@@ -0,0 +1,81 @@
+"""Small in-process caches for read-mostly endpoints.
+
+Each worker process keeps its own copy, so entries carry a TTL to bound how stale a
+worker can get when another process commits the change.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 128) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_on_commit(cache: TTLCache, *model_classes: Type[Any]) -> None:
+    """Empty ``cache`` after any ORM commit that inserted, updated or deleted one of ``model_classes``."""
+    flag = f"clear_cache_{id(cache)}"
+
+    @event.listens_for(Session, "after_flush")
+    def _mark(session: Session, _flush_context) -> None:
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(instance, model_classes):
+                session.info[flag] = True
+                return
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _mark_statement(orm_execute_state) -> None:
+        # insert()/update()/delete() statements against a model bypass the flush.
+        if orm_execute_state.is_select:
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, model_classes):
+            orm_execute_state.session.info[flag] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _clear(session: Session) -> None:
+        if session.info.pop(flag, False):
+            cache.clear()
+
+    @event.listens_for(Session, "after_rollback")
+    def _forget(session: Session) -> None:
+        session.info.pop(flag, None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from .. import models
@@ -27,14 +28,24 @@ def record_reward_entry(
     partner_name: str | None = None,
     status: str = "posted",
 ) -> models.RewardLedgerEntry:
-    """Persist a new ledger entry and keep the aggregate reward_points in sync."""
+    """Persist a new ledger entry and keep the aggregate reward_points in sync.
+
+    The balance check and update run as one UPDATE, so two concurrent debits cannot both spend
+    the same points.
+    """
     if delta == 0:
         raise ValueError("delta must be non-zero")
 
-    current_balance = int(user.reward_points or 0)
-    next_balance = current_balance + delta
-    if next_balance < 0:
+    result = db.execute(
+        update(models.User)
+        .where(models.User.id == user.id, models.User.reward_points + delta >= 0)
+        .values(reward_points=models.User.reward_points + delta)
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
         raise ValueError("Insufficient reward points for this operation.")
+    # Reload the new balance on next access rather than trusting the in-memory value.
+    db.expire(user, ["reward_points"])
 
     entry = models.RewardLedgerEntry(
         user_id=user.id,
@@ -46,7 +57,38 @@ def record_reward_entry(
         status=status,
     )
 
-    user.reward_points = next_balance
-    db.add(user)
+    db.add(entry)
+    return entry
+
+
+def credit_reward_points(
+    db: Session,
+    user_id: int,
+    delta: int,
+    source: str,
+    description: str,
+) -> models.RewardLedgerEntry | None:
+    """Credit ``delta`` points without loading the user; None when the user does not exist.
+
+    The balance is bumped in SQL, so concurrent credits to one user cannot overwrite each other.
+    """
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+
+    result = db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(reward_points=models.User.reward_points + delta)
+    )
+    if not result.rowcount:
+        return None
+
+    entry = models.RewardLedgerEntry(
+        user_id=user_id,
+        delta=delta,
+        source=source,
+        description=_truncate_description(description),
+        status="posted",
+    )
     db.add(entry)
     return entry
@@ -1,33 +1,42 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, Iterable, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .. import models
 
 
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+# ASCII input (the common case) is cleaned with one C-level translate instead of the regex.
+_ASCII_NON_ALNUM = str.maketrans(
+    {chr(code): " " for code in range(128) if not (chr(code).islower() or chr(code).isdigit())}
+)
+
+
 def _normalize(value: str) -> str:
     cleaned = value.strip().lower()
     cleaned = cleaned.replace("&", " and ")
-    cleaned = re.sub(r"[^a-z0-9]+", " ", cleaned)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_ASCII_NON_ALNUM)
+    else:
+        cleaned = _NON_ALNUM.sub(" ", cleaned)
+    return " ".join(cleaned.split())
 
 
 def _build_lookup(
     entries: Iterable[dict],
 ) -> Tuple[Dict[str, Tuple[float, float]], list[Tuple[str, Tuple[float, float]]]]:
     exact: Dict[str, Tuple[float, float]] = {}
-    patterns: list[Tuple[str, Tuple[float, float]]] = []
     for entry in entries:
         coords = (entry["lat"], entry["lng"])
         for alias in entry["aliases"]:
             normalized = _normalize(alias)
-            if not normalized:
-                continue
-            if normalized not in exact:
+            if normalized and normalized not in exact:
                 exact[normalized] = coords
-            patterns.append((normalized, coords))
+    # Longest aliases first, so the first substring hit is the most specific one.
+    patterns = sorted(exact.items(), key=lambda item: len(item[0]), reverse=True)
     return exact, patterns
 
 
@@ -74,6 +83,8 @@ KNOWN_LOCATIONS = [
 _KNOWN_LOOKUP, _KNOWN_PATTERNS = _build_lookup(KNOWN_LOCATIONS)
 
 
+# Reports cluster on the same few places, so repeat texts skip normalizing and the alias scan.
+@lru_cache(maxsize=2048)
 def lookup_known_coordinates(location_text: Optional[str]) -> Optional[Tuple[float, float]]:
     if not location_text:
         return None
@@ -86,7 +97,7 @@ def lookup_known_coordinates(location_text: Optional[str]) -> Optional[Tuple[flo
         return direct
 
     for pattern, coords in _KNOWN_PATTERNS:
-        if pattern and pattern in normalized:
+        if pattern in normalized:
             return coords
     return None
 
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Optional
+
+
+def decode_base64_payload(payload: Optional[str]) -> Optional[bytes]:
+    """Decode an uploaded base64 body (bare or as a data URL); None when it is not valid base64."""
+    cleaned = (payload or "").strip()
+    if cleaned.startswith("data:") and "," in cleaned:
+        # Some clients upload full data URLs rather than the bare base64 body.
+        cleaned = cleaned.split(",", 1)[1]
+    try:
+        return base64.b64decode(cleaned, validate=True)
+    except (binascii.Error, ValueError):
+        return None
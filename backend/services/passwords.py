@@ -0,0 +1,96 @@
+"""Password hashing and verification.
+
+Kept apart from ``backend.security`` so CLI scripts can hash passwords without importing FastAPI
+or the JWT stack.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+from passlib.exc import MissingBackendError
+from passlib.hash import argon2
+
+# bcrypt 在某些 macOS / conda 环境下会加载到系统旧版扩展，触发 MissingBackendError。
+# 统一改用 pbkdf2_sha256，避免对底层 C 扩展的依赖。
+# 装了 argon2-cffi 时新密码改用 argon2id，旧的 pbkdf2_sha256 哈希在下次登录时自动升级。
+# 第一个 scheme 为默认哈希算法；argon2 始终保留在列表里，以便识别已有的 argon2 哈希。
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"] if argon2.has_backend() else ["pbkdf2_sha256", "argon2"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=1,
+)
+
+FALLBACK_PREFIX = "sha256$"
+VERIFIED_PASSWORD_CACHE_SIZE = 1024
+VERIFIED_PASSWORD_TTL_SECONDS = 60
+
+# Successful KDF verifications keyed by the stored hash -> (sha256 of the password, expiry).
+# A password change produces a new hash, so stale entries can never match it.
+_verified_passwords: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+_verified_passwords_lock = threading.Lock()
+
+
+def _recently_verified(hashed_password: str, digest: bytes) -> bool:
+    with _verified_passwords_lock:
+        cached = _verified_passwords.get(hashed_password)
+        if cached is None:
+            return False
+        cached_digest, expires_at = cached
+        if expires_at <= time.monotonic():
+            del _verified_passwords[hashed_password]
+            return False
+        _verified_passwords.move_to_end(hashed_password)
+    return hmac.compare_digest(cached_digest, digest)
+
+
+def _remember_verified(hashed_password: str, digest: bytes) -> None:
+    with _verified_passwords_lock:
+        _verified_passwords[hashed_password] = (digest, time.monotonic() + VERIFIED_PASSWORD_TTL_SECONDS)
+        _verified_passwords.move_to_end(hashed_password)
+        while len(_verified_passwords) > VERIFIED_PASSWORD_CACHE_SIZE:
+            _verified_passwords.popitem(last=False)
+
+
+def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    if not hashed_password:
+        return False
+    if hashed_password.startswith(FALLBACK_PREFIX):
+        expected = hashlib.sha256(plain_password.encode("utf-8")).hexdigest()
+        return hashed_password.split("$", 1)[1] == expected
+
+    # Only successes are cached: failed attempts keep paying the full KDF cost.
+    digest = hashlib.sha256(plain_password.encode("utf-8")).digest()
+    if _recently_verified(hashed_password, digest):
+        return True
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+    _remember_verified(hashed_password, digest)
+    return True
+
+
+def password_needs_rehash(hashed_password: Optional[str]) -> bool:
+    """True when a verified hash should be replaced with one from the preferred scheme."""
+    if not hashed_password:
+        return False
+    if hashed_password.startswith(FALLBACK_PREFIX):
+        return True
+    return pwd_context.needs_update(hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    try:
+        return pwd_context.hash(password)
+    except MissingBackendError:
+        # Dev fallback when bcrypt extras are unavailable.
+        digest = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        return f"{FALLBACK_PREFIX}{digest}"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 
 TIER_LADDER: List[Tuple[str, int]] = [
@@ -10,6 +11,7 @@ TIER_LADDER: List[Tuple[str, int]] = [
     ("Community Sentinel", 120),
     ("Civic Guardian", 250),
 ]
+TIER_THRESHOLDS: List[int] = [threshold for _, threshold in TIER_LADDER]
 
 STATUS_TARGETS = {
     "community-confirmed": 10,
@@ -38,28 +40,17 @@ REWARD_PARTNERS: List[Dict[str, object]] = [
 def determine_membership_tier(points: Optional[int]) -> str:
     """Return the tier label that corresponds to the provided point balance."""
     safe_points = int(points or 0)
-    tier = TIER_LADDER[0][0]
-    for name, threshold in TIER_LADDER:
-        if safe_points >= threshold:
-            tier = name
-        else:
-            break
-    return tier
+    index = bisect_right(TIER_THRESHOLDS, safe_points) - 1
+    return TIER_LADDER[max(index, 0)][0]
 
 
 def tier_progress(points: Optional[int]) -> Dict[str, Optional[object]]:
     """Provide the caller with the current tier, the next tier, and gap to unlock it."""
     safe_points = int(points or 0)
-    current = TIER_LADDER[0]
-    next_target: Optional[Tuple[str, int]] = None
-
-    for idx, (name, threshold) in enumerate(TIER_LADDER):
-        if safe_points >= threshold:
-            current = (name, threshold)
-            next_target = TIER_LADDER[idx + 1] if idx + 1 < len(TIER_LADDER) else None
-        else:
-            next_target = (name, threshold)
-            break
+    # Same bisect as determine_membership_tier instead of walking the ladder.
+    index = bisect_right(TIER_THRESHOLDS, safe_points)
+    current = TIER_LADDER[max(index - 1, 0)]
+    next_target = TIER_LADDER[index] if index < len(TIER_LADDER) else None
 
     remaining = None
     if next_target:
@@ -20,6 +20,20 @@ def requires_manual_approval(role: Optional[str]) -> bool:
     return role in SENSITIVE_ROLES
 
 
+def build_role_request(
+    user: models.User,
+    requested_role: str,
+    justification: Optional[str] = None,
+) -> models.RoleRequest:
+    """Pending request for a brand-new user; flushed together with the user row."""
+    return models.RoleRequest(
+        user=user,
+        requested_role=requested_role,
+        justification=justification,
+        status="pending",
+    )
+
+
 def queue_role_request(
     db: Session,
     user: models.User,
@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+_TMP_DIR = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP_DIR, 'oauth.db')}"
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from jose import jwk, jwt  # noqa: E402
+
+from backend.db import SessionLocal  # noqa: E402
+from backend.main import app  # noqa: E402
+from backend import models  # noqa: E402
+from backend.routers import auth  # noqa: E402
+
+AUDIENCE = "test-client"
+ISSUER = "https://accounts.google.com"
+
+
+def _signing_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = kid
+    return pem, public_jwk
+
+
+class OAuthLoginTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.jwks_path = os.path.join(_TMP_DIR, "jwks.json")
+        cls.pem, public_jwk = _signing_key("key-1")
+        cls._write_jwks([public_jwk])
+        cls.patches = [
+            mock.patch.dict(auth.OAUTH_JWKS_URLS, {"google": f"file://{cls.jwks_path}"}),
+            mock.patch.dict(auth.OAUTH_AUDIENCES, {"google": AUDIENCE}),
+        ]
+        for patch in cls.patches:
+            patch.start()
+        cls.client = TestClient(app)
+        cls.client.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+        for patch in cls.patches:
+            patch.stop()
+
+    @classmethod
+    def _write_jwks(cls, keys):
+        with open(cls.jwks_path, "w") as handle:
+            json.dump({"keys": keys}, handle)
+
+    def setUp(self):
+        auth._jwks_cache.clear()
+
+    def _id_token(self, pem=None, kid="key-1", **claims):
+        payload = {"aud": AUDIENCE, "iss": ISSUER, "exp": int(time.time()) + 600, "email_verified": True}
+        payload.update(claims)
+        return jwt.encode(payload, pem or self.pem, algorithm="RS256", headers={"kid": kid})
+
+    def test_request_email_cannot_override_verified_claim(self):
+        response = self.client.post(
+            "/auth/register", json={"email": "victim@example.com", "password": "password1"}
+        )
+        self.assertEqual(response.status_code, 201, response.text)
+        victim_id = response.json()["user"]["id"]
+
+        token = self._id_token(sub="attacker-sub", email="attacker@example.com")
+        response = self.client.post(
+            "/auth/oauth",
+            json={"provider": "google", "id_token": token, "email": "victim@example.com"},
+        )
+
+        self.assertEqual(response.status_code, 200, response.text)
+        user = response.json()["user"]
+        self.assertNotEqual(user["id"], victim_id)
+        self.assertEqual(user["email"], "attacker@example.com")
+        db = SessionLocal()
+        try:
+            victim = db.get(models.User, victim_id)
+            self.assertEqual(victim.auth_provider, "password")
+            self.assertIsNone(victim.provider_subject)
+        finally:
+            db.close()
+
+    def test_unverified_provider_email_is_rejected(self):
+        token = self._id_token(sub="unverified-sub", email="someone@example.com", email_verified=False)
+        response = self.client.post("/auth/oauth", json={"provider": "google", "id_token": token})
+        self.assertEqual(response.status_code, 401, response.text)
+
+    def test_rotated_key_is_fetched_when_kid_is_unknown(self):
+        self.client.post(
+            "/auth/oauth",
+            json={"provider": "google", "id_token": self._id_token(sub="rotate-sub", email="rotate@example.com")},
+        )
+        rotated_pem, rotated_jwk = _signing_key("key-2")
+        self._write_jwks([rotated_jwk])
+        # Pretend the cached set is older than the refetch throttle.
+        provider_jwks, expires_at = auth._jwks_cache["google"]
+        auth._jwks_cache["google"] = (provider_jwks, expires_at - auth.OAUTH_JWKS_MIN_REFETCH_SECONDS)
+
+        token = self._id_token(pem=rotated_pem, kid="key-2", sub="rotate-sub", email="rotate@example.com")
+        response = self.client.post("/auth/oauth", json={"provider": "google", "id_token": token})
+        self.assertEqual(response.status_code, 200, response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,7 @@ import * as FileSystem from 'expo-file-system';
 import {
   Incident,
   IncidentComment,
+  apiUrl,
   createComment,
   createFollowUp,
   fetchIncident,
@@ -274,10 +275,20 @@ export function IncidentDetailSheet({ incidentId, visible, onClose, onMutated, o
 
   const handleOpenAttachment = async (media: {
     data_base64?: string | null;
+    url?: string;
     media_type?: string;
     content_type?: string | null;
     filename?: string | null;
   }) => {
+    if (media?.url) {
+      // Comment attachments are served by the API; moderator URLs for hidden comments are signed.
+      try {
+        await Linking.openURL(apiUrl(media.url));
+      } catch (err) {
+        console.warn('Unable to open attachment', err);
+      }
+      return;
+    }
     if (!media?.data_base64) {
       return;
     }
@@ -772,12 +783,10 @@ export function IncidentDetailSheet({ incidentId, visible, onClose, onMutated, o
                         showsHorizontalScrollIndicator={false}
                         contentContainerStyle={styles.commentAttachmentPreviewRow}>
                         {comment.attachments.map((attachment) =>
-                          attachment.media_type === 'image' && attachment.data_base64 ? (
+                          attachment.media_type === 'image' ? (
                             <Pressable key={attachment.id} onPress={() => handleOpenAttachment(attachment)}>
                               <Image
-                                source={{
-                                  uri: `data:${attachment.content_type || 'image/jpeg'};base64,${attachment.data_base64}`,
-                                }}
+                                source={{ uri: apiUrl(attachment.url) }}
                                 style={styles.attachmentImage}
                               />
                             </Pressable>
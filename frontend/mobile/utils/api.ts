@@ -122,8 +122,9 @@ export type IncidentComment = {
     id: number;
     media_type: string;
     content_type: string | null;
-    data_base64: string | null;
     filename: string | null;
+    url: string;
+    created_at: string;
   }>;
   likes_count: number;
   unlikes_count: number;
@@ -359,6 +360,10 @@ export function setCommentReaction(
   });
 }
 
+export function apiUrl(path: string) {
+  return `${API_BASE}${path}`;
+}
+
 export function getApiBaseUrl() {
   return API_BASE;
 }
@@ -28,6 +28,10 @@ export const apiClient = axios.create({
   baseURL: API_BASE,
 });
 
+export function apiUrl(path) {
+  return `${API_BASE}${path}`;
+}
+
 export function setAuthToken(token) {
   if (token) {
     apiClient.defaults.headers.common.Authorization = `Bearer ${token}`;
@@ -115,10 +119,11 @@ export async function fetchProfile() {
   return resp.data;
 }
 
-export async function createComment(incidentId, data) {
-  const resp = await apiClient.post(`/incidents/${incidentId}/comments`, data, {
-    headers: { "Content-Type": "application/json" },
-  });
+export async function createComment(incidentId, { body, files = [] }) {
+  const form = new FormData();
+  form.append("body", body);
+  files.forEach((file) => form.append("files", file));
+  const resp = await apiClient.post(`/incidents/${incidentId}/comments/upload`, form);
   return resp.data;
 }
 
@@ -146,6 +151,13 @@ export async function markNotificationRead(id) {
   return resp.data;
 }
 
+export async function markNotificationsRead({ ids = [], all = false } = {}) {
+  const resp = await apiClient.post("/notifications/read", { ids, all }, {
+    headers: { "Content-Type": "application/json" },
+  });
+  return resp.data;
+}
+
 export async function fetchUserOverview() {
   const resp = await apiClient.get("/users/me/overview");
   return resp.data;
@@ -1,5 +1,12 @@
 import { useEffect, useMemo, useState } from "react";
-import { createComment, createFollowUp, setCommentReaction, setIncidentReaction, updateIncident } from "../api.js";
+import {
+  apiUrl,
+  createComment,
+  createFollowUp,
+  setCommentReaction,
+  setIncidentReaction,
+  updateIncident,
+} from "../api.js";
 import { useAuth } from "../context/AuthContext.jsx";
 import { IncidentMapPreview } from "./IncidentMapPreview.jsx";
 
@@ -50,12 +57,11 @@ function readFileAsDataURL(file) {
         reject(new Error("Invalid file result"));
         return;
       }
-      const [prefix, base64] = reader.result.split(",", 2);
       const mediaType = file.type.startsWith("video") ? "video" : "image";
       resolve({
         id: `${Date.now()}-${Math.random().toString(16).slice(2)}`,
         dataUrl: reader.result,
-        base64: base64 || reader.result,
+        file,
         filename: file.name,
         contentType: file.type || (mediaType === "image" ? "image/*" : "video/*"),
         mediaType,
@@ -287,15 +293,9 @@ export default function IncidentCard({ incident, onMutated, onRequireAuth = () =
     setCommentError("");
     setCommentSuccess("");
     try {
-      const mediaPayload = commentMedia.map((item) => ({
-        media_type: item.mediaType,
-        content_type: item.contentType,
-        data_base64: item.base64,
-        filename: item.filename,
-      }));
       const created = await createComment(incident.id, {
         body,
-        media: mediaPayload,
+        files: commentMedia.map((item) => item.file),
       });
       setCommentBody("");
       setCommentMedia([]);
@@ -801,9 +801,7 @@ export default function IncidentCard({ incident, onMutated, onRequireAuth = () =
                 {comment.attachments?.length > 0 && (
                   <div className="mt-3 grid gap-3 xs:grid-cols-2">
                     {comment.attachments.map((attachment) => {
-                      const contentType =
-                        attachment.content_type || (attachment.media_type === "video" ? "video/mp4" : "image/png");
-                      const src = `data:${contentType};base64,${attachment.data_base64}`;
+                      const src = apiUrl(attachment.url);
                       return (
                         <div
                           key={attachment.id}
@@ -1,5 +1,5 @@
 import { useEffect, useMemo, useRef, useState } from "react";
-import { fetchNotifications, markNotificationRead } from "../api.js";
+import { fetchNotifications, markNotificationRead, markNotificationsRead } from "../api.js";
 import { useAuth } from "../context/AuthContext.jsx";
 
 const VERIFIER_ROLES = new Set(["admin", "reporter", "officer"]);
@@ -71,6 +71,15 @@ export default function NotificationBell() {
     }
   }
 
+  async function handleMarkAllRead() {
+    try {
+      await markNotificationsRead({ all: true });
+      setNotifications((prev) => prev.map((item) => ({ ...item, status: "read" })));
+    } catch (err) {
+      console.error(err);
+    }
+  }
+
   if (!isVerifier) {
     return null;
   }
@@ -96,14 +105,25 @@ export default function NotificationBell() {
         <div className="absolute right-0 z-20 mt-2 w-80 rounded-2xl border border-slate-200 bg-white p-4 text-xs text-slate-600 shadow-xl">
           <div className="flex items-center justify-between text-[11px] font-semibold text-ink">
             <span>Verification requests</span>
-            <button
-              type="button"
-              className="text-[11px] text-slate-500 transition hover:text-ink"
-              onClick={loadNotifications}
-              disabled={loading}
-            >
-              {loading ? "Refreshing…" : "Refresh"}
-            </button>
+            <div className="flex items-center gap-3">
+              {unreadCount > 0 && (
+                <button
+                  type="button"
+                  className="text-[11px] text-amber-700 transition hover:text-amber-900"
+                  onClick={handleMarkAllRead}
+                >
+                  Mark all read
+                </button>
+              )}
+              <button
+                type="button"
+                className="text-[11px] text-slate-500 transition hover:text-ink"
+                onClick={loadNotifications}
+                disabled={loading}
+              >
+                {loading ? "Refreshing…" : "Refresh"}
+              </button>
+            </div>
           </div>
 
           {error && <p className="mt-3 rounded-xl bg-rose-50 px-3 py-2 text-rose-600">{error}</p>}